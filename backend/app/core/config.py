@@ -29,6 +29,7 @@ class ZeroMQConfig:
         self.publisherAddress = os.getenv('ZMQ_PUBLISHER_ADDRESS', '192.168.1.103')   # IP do endereço a emitir o ZEROMQ
         self.subscriberPort = int(os.getenv('ZMQ_SUBSCRIBER_PORT', 22881))           # Port SINK_SUB_ADDR
         self.timeout = int(os.getenv('ZMQ_TIMEOUT', 1000))                           # Timeout em milissegundos
+        self.numpyExtType = 1                                                        # Código ExtType msgpack para arrays NumPy
         # URL completo para conexão
         self.fullSubscriberUrl = f"tcp://{self.publisherAddress}:{self.subscriberPort}"
         
@@ -280,11 +281,13 @@ class ZeroMQConfig:
         }
                 # Log configuração ao inicializar
         if os.getenv('DEBUG', 'False').lower() in ('true', '1', 'yes'):
-            print(f"ZeroMQ PUB/SUB Config:")
-            print(f"  Publisher: {self.publisherAddress}:{self.subscriberPort}")
-            print(f"  Topics: {len(self.topics)} configured")
-            print(f"  Primary topics: Polar_PPI, CardioWheel_ECG, BrainAcess_EEG")
-            print(f"  Timeout: {self.timeout}ms, Message timeout: {self.messageTimeout}s")
+            print("\n".join([
+                "ZeroMQ PUB/SUB Config:",
+                f"  Publisher: {self.publisherAddress}:{self.subscriberPort}",
+                f"  Topics: {len(self.topics)} configured",
+                "  Primary topics: Polar_PPI, CardioWheel_ECG, BrainAcess_EEG",
+                f"  Timeout: {self.timeout}ms, Message timeout: {self.messageTimeout}s"
+            ]))
 
 class MockZeroMQConfig:
     """Configurações para sistema mock ZeroMQ"""
@@ -297,6 +300,9 @@ class MockZeroMQConfig:
         # Configurações de socket mock
         self.mockLingerTime = 1000                  # ms
         self.mockSendHighWaterMark = 1000          # Limite de mensagens em buffer
+        self.mockSendBufferSize = 4 * 1024 * 1024  # Buffer TCP de envio mínimo (bytes)
+        self.mockTcpKeepalive = 1                  # Keepalive TCP (evita desconexões em idle)
+        self.mockIoThreads = min(4, os.cpu_count() or 2)  # Threads de IO do contexto ZeroMQ
         self.mockSocketType = "PUB"                # Tipo de socket (PUB para enviar)
         
         # Frequências de publicação por tópico (Hz)
@@ -579,18 +585,22 @@ class MockZeroMQConfig:
             "maxMessagesPerSecond": 200,           # Limite global de mensagens/segundo
             "maxMessageSize": 20240,               # Tamanho máximo da mensagem (20KB)
             "bufferSize": 1000,                    # Tamanho do buffer de envio
-            "batchSendEnabled": False,             # Envio em lote (para otimização futura)
+            "batchSendEnabled": True,              # Envio em lote (fila drenada por uma única task)
             "compressionEnabled": False,           # Compressão de mensagens (para otimização futura)
+            "numpyExtEnabled": False,              # Arrays ECG/ACC/GYR/EEG como ExtType NumPy (formato diferente do real)
+            "singleFloatEnabled": False,           # Floats msgpack em 32 bits (EEG em float32, precisão diferente do real)
             "metricsUpdateInterval": 5.0           # Intervalo de atualização de métricas
         }
         
         # Log configuração ao inicializar se debug ativo
         if os.getenv('DEBUG', 'False').lower() in ('true', '1', 'yes'):
-            print(f"Mock ZeroMQ Config:")
-            print(f"  Publisher: {self.mockPublisherUrl}")
-            print(f"  Topics: {list(self.topicFrequencies.keys())}")
-            print(f"  Frequencies: ECG={self.topicFrequencies['CardioWheel_ECG']}Hz, PPI={self.topicFrequencies['Polar_PPI']}Hz")
-            print(f"  Anomalies: {'Enabled' if self.anomalyInjection['enabled'] else 'Disabled'}")
+            print("\n".join([
+                "Mock ZeroMQ Config:",
+                f"  Publisher: {self.mockPublisherUrl}",
+                f"  Topics: {list(self.topicFrequencies.keys())}",
+                f"  Frequencies: ECG={self.topicFrequencies['CardioWheel_ECG']}Hz, PPI={self.topicFrequencies['Polar_PPI']}Hz",
+                f"  Anomalies: {'Enabled' if self.anomalyInjection['enabled'] else 'Disabled'}"
+            ]))
 
 class WebSocketConfig:
     """Configurações WebSocket"""
@@ -1050,13 +1060,15 @@ class SignalControlConfig:
         
         # Log configuração se debug ativo
         if os.getenv('DEBUG', 'False').lower() in ('true', '1', 'yes'):
-            print(f"Signal Control Config:")
-            print(f"  Available components: {len(self.availableComponents)}")
-            print(f"  ZeroMQ Topics: {self.zeroMQTopics}")
-            print(f"  Signal Types: {self.signalTypes}")
-            print(f"  Mapping: {self.topicToSignalTypeMapping}")
-            print(f"  Default state: All signals active")
-            print(f"  Persist state: {self.persistState}")
+            print("\n".join([
+                "Signal Control Config:",
+                f"  Available components: {len(self.availableComponents)}",
+                f"  ZeroMQ Topics: {self.zeroMQTopics}",
+                f"  Signal Types: {self.signalTypes}",
+                f"  Mapping: {self.topicToSignalTypeMapping}",
+                "  Default state: All signals active",
+                f"  Persist state: {self.persistState}"
+            ]))
 
 class Settings:
     """Configurações principais"""
@@ -1113,15 +1125,17 @@ settings = Settings()
 
 # Debug info
 if settings.debugMode:
-    print(f"Settings loaded: {settings.projectName} v{settings.version}")
-    print(f"Debug mode: {settings.debugMode}")
-    print(f"Log level: {settings.logLevel}")
-    print(f"ZeroMQ Sensor port: {settings.zeromq.subscriberPort}")
-    print(f"WebSocket update interval: {settings.websocket.updateInterval}s")
     #print(f"Cardiac thresholds: Bradycardia={settings.signals.cardiacConfig['hr']['bradycardiaThreshold']}, Tachycardia={settings.signals.cardiacConfig['hr']['tachycardiaThreshold']}")
     #print(f"EEG channels: {settings.signals.eegConfig['raw']['channels']}, Range: {settings.signals.eegConfig['raw']['normalRange']}")
-    print(f"Mock ZeroMQ Publisher: {settings.mockZeromq.mockPublisherUrl}")
-    print(f"Mock frequencies: ECG={settings.mockZeromq.topicFrequencies['CardioWheel_ECG']}Hz")
+    print("\n".join([
+        f"Settings loaded: {settings.projectName} v{settings.version}",
+        f"Debug mode: {settings.debugMode}",
+        f"Log level: {settings.logLevel}",
+        f"ZeroMQ Sensor port: {settings.zeromq.subscriberPort}",
+        f"WebSocket update interval: {settings.websocket.updateInterval}s",
+        f"Mock ZeroMQ Publisher: {settings.mockZeromq.mockPublisherUrl}",
+        f"Mock frequencies: ECG={settings.mockZeromq.topicFrequencies['CardioWheel_ECG']}Hz"
+    ]))
 
 
 
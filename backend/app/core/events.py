@@ -20,6 +20,9 @@ Funcionalidades principais:
 - `emit(eventName, data)`: Emite um evento com os dados fornecidos. Todos os 
     "listeners" associados a esse evento são executados em paralelo (de forma assíncrona).
 
+- `hasListeners(eventName)`: Indica se existe algum listener para o evento, para que 
+    caminhos frequentes possam saltar a construção dos dados quando ninguém os consome.
+
 - `getListenerCount()`: Devolve estatísticas básicas, como o número total de listeners 
     registados e os tipos de eventos com listeners.
 
@@ -44,6 +47,8 @@ from dataclasses import dataclass
 
 @dataclass
 class Event:
+    __slots__ = ("name", "data", "timestamp")  # Criado em cada emit: sem __dict__ por instância
+    
     name: str               # Nome do evento (e.g., "signal.updated")
     data: Dict[str, Any]    # Dados do evento (e.g., {"ecg": 75.5})
     timestamp: datetime     # Quando o evento foi emitido
@@ -53,6 +58,7 @@ class EventManager:
     
     def __init__(self):
         self._listeners: Dict[str, List[Callable]] = {} # Lista de listeners
+        self._listenerTotal = 0 # Total de listeners mantido incrementalmente (evita percorrer todos os eventos)
         self._logger = logging.getLogger(__name__)
     
     def subscribe(self, eventName: str, callback: Callable) -> None:
@@ -60,6 +66,7 @@ class EventManager:
         if eventName not in self._listeners:
             self._listeners[eventName] = []
         self._listeners[eventName].append(callback)
+        self._listenerTotal += 1
         self._logger.debug(f"Subscribed to: {eventName}")
     
     def unsubscribe(self, eventName: str, callback: Callable) -> None:
@@ -67,10 +74,15 @@ class EventManager:
         if eventName in self._listeners:
             try:
                 self._listeners[eventName].remove(callback)
+                self._listenerTotal -= 1
                 self._logger.debug(f"Unsubscribed from: {eventName}")
             except ValueError:
                 self._logger.warning(f"Callback not found for event: {eventName}")
     
+    def hasListeners(self, eventName: str) -> bool:
+        """Indica se o evento tem listeners (permite evitar construir dados que ninguém consome)"""
+        return bool(self._listeners.get(eventName))
+    
     async def emit(self, eventName: str, data: Dict[str, Any]) -> None:
         """Emite evento async - todos os listeners executam em paralelo"""
         event = Event(
@@ -79,16 +91,26 @@ class EventManager:
             timestamp=datetime.now()
         )
         
-        self._logger.debug(f"Emitting event: {eventName} with data: {data}")
+        # Formatação lazy: o dict de dados só é convertido em texto se DEBUG estiver ativo
+        self._logger.debug("Emitting event: %s with data: %s", eventName, data)
         
         # Verificar se há listeners para este evento
-        if eventName not in self._listeners:
-            self._logger.debug(f"No listeners for event: {eventName}")
+        listeners = self._listeners.get(eventName)
+        if not listeners:
+            self._logger.debug("No listeners for event: %s", eventName)
+            return
+        
+        # Caso mais comum (um único listener async): aguardar diretamente, sem criar task nem gather
+        if len(listeners) == 1 and asyncio.iscoroutinefunction(listeners[0]):
+            try:
+                await listeners[0](event)
+            except Exception as e:
+                self._logger.error(f"Listener 0 for event {eventName} failed: {e}")
             return
         
         # Criar tasks para todos os listeners
         tasks = []
-        for callback in self._listeners[eventName]:
+        for callback in listeners:
             try:
                 # Verificar se é async function
                 if asyncio.iscoroutinefunction(callback):
@@ -123,7 +145,7 @@ class EventManager:
     def getListenerCount(self) -> Dict[str, int]:
         """Stats para debug"""
         return {
-            "totalListeners": sum(len(listeners) for listeners in self._listeners.values()),
+            "totalListeners": self._listenerTotal,
             "eventTypes": len(self._listeners),
             "eventsWithListeners": list(self._listeners.keys())
         }
@@ -144,6 +166,7 @@ class EventManager:
     def clear(self) -> None:
         """Limpar todos os listeners (útil para testes)"""
         self._listeners.clear()
+        self._listenerTotal = 0
         self._logger.info("All event listeners cleared")
 
 # ================================
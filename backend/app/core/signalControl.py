@@ -18,7 +18,7 @@ import asyncio
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, List, Set, Any, Optional, Union
+from typing import Dict, List, Sequence, Set, Any, Optional, Union
 from enum import Enum
 
 from . import settings, eventManager
@@ -66,12 +66,15 @@ class SignalControlInterface(ABC):
     """
     
     @abstractmethod
-    def getAvailableSignals(self) -> List[str]:
+    def getAvailableSignals(self) -> Sequence[str]:
         """
-        Retorna lista de sinais que este componente pode processar.
+        Retorna os sinais que este componente pode processar.
+        
+        Os chamadores apenas leem o resultado; componentes podem devolver uma
+        vista imutável (tuple) em vez de uma cópia da lista.
         
         Returns:
-            Lista de nomes de sinais disponíveis
+            Sequência de nomes de sinais disponíveis
         """
         pass
     
@@ -3,7 +3,8 @@ Classe base abstrata para todos os sinais
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Union
+from collections import deque
+from typing import Deque, List, Optional, Dict, Any, Union
 from datetime import datetime, timedelta
 import logging
 import numpy as np
@@ -13,6 +14,8 @@ from .dataPoint import SignalPoint, DataBuffer, SignalMetrics
 class BaseSignal(ABC):
     """Classe base para todos os tipos de sinais"""
     
+    maxAnomalies = 10  # Limite de anomalias mantidas por sinal
+    
     def __init__(self, signalName: str, bufferSize: int, samplingRate: Union[int, str] = None):
         self.signalName = signalName
         self.bufferSize = bufferSize
@@ -20,7 +23,7 @@ class BaseSignal(ABC):
         self.buffer = DataBuffer(bufferSize)
         self.isActive = False
         self.lastUpdate: Optional[datetime] = None
-        self.anomalies: List[str] = []
+        self.anomalies: Deque[str] = deque(maxlen=self.maxAnomalies)  # Descarta as mais antigas em O(1)
         self.logger = logging.getLogger(f"{__name__}.{signalName}")
         
         self.logger.info(f"Signal {signalName} initialized - Buffer: {bufferSize}, Rate: {samplingRate}")
@@ -58,7 +61,7 @@ class BaseSignal(ABC):
             # Detectar anomalias
             self._checkForAnomalies()
             
-            self.logger.debug(f"Point added to {self.signalName}: {point.value}")
+            self.logger.debug("Point added to %s: %s", self.signalName, point.value)
             return True
             
         except Exception as e:
@@ -143,10 +146,6 @@ class BaseSignal(ABC):
             if anomaly not in self.anomalies:
                 self.anomalies.append(anomaly)
                 self.logger.warning(f"NOVA anomalia detectada em {self.signalName}: {anomaly}")
-        
-        # Manter limite de 10 anomalias
-        if len(self.anomalies) > 10:
-            self.anomalies = self.anomalies[-10:]
     
     def getRecentAnomalies(self, maxAge: timedelta = None) -> List[str]:
         """Retorna anomalias recentes""" #TODO 
@@ -154,7 +153,7 @@ class BaseSignal(ABC):
             #maxAge = timedelta(minutes=5)
         
         # Para simplicidade retornar todas as anomalias por enqautno
-        return self.anomalies.copy()
+        return list(self.anomalies)
     
     def clearAnomalies(self) -> None:
         """Limpa histórico de anomalias"""
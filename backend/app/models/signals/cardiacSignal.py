@@ -20,9 +20,9 @@ Feito com o objetivo de suportar com qualquer fonte de dados cardíacos, seja Ca
 
 """
 
+import time
 import numpy as np
 from typing import List, Optional, Any
-from datetime import datetime
 
 from ..base import BaseSignal
 from ..dataPoint import SignalPoint
@@ -59,8 +59,53 @@ class CardiacSignal(BaseSignal):
         self.ecgFlatThreshold = cardiacConfig["ecg"]["flatThreshold"]
         self.ecgDriftThreshold = cardiacConfig["ecg"]["driftThreshold"]
         
+        # Ring buffer contíguo com as últimas amostras ECG (30s a 1000Hz), evita percorrer/copiar o buffer de pontos
+        self.ecgRingCapacity = cardiacConfig["ecg"]["bufferSize"]
+        self._ecgRing = np.zeros(self.ecgRingCapacity, dtype=np.float64)
+        self._ecgHead = 0           # Próxima posição de escrita
+        self._ecgCount = 0          # Amostras válidas no ring
+        
+        # Último HR e número de sequência do ponto (para saber se já saiu do buffer de pontos)
+        self._pointSequence = 0
+        self._latestHr: Optional[float] = None
+        self._latestHrSequence = 0
+        
         self.logger.info(f"CardiacSignal initialized - Normal HR Range: {self.hrNormalRange}")
     
+    def addPoint(self, point: SignalPoint) -> bool:
+        """Adiciona ponto ao sinal e atualiza o ring ECG / último HR"""
+        if not super().addPoint(point):
+            return False
+        
+        self._pointSequence += 1
+        
+        if isinstance(point.value, (int, float)):
+            self._latestHr = point.value
+            self._latestHrSequence = self._pointSequence
+        else:
+            self._appendEcgSamples(np.asarray(point.value, dtype=np.float64))
+        
+        return True
+    
+    def _appendEcgSamples(self, samples: np.ndarray) -> None:
+        """Escreve amostras ECG no ring buffer (em duas fatias quando dá a volta)"""
+        capacity = self.ecgRingCapacity
+        count = len(samples)
+        
+        if count >= capacity:
+            self._ecgRing[:] = samples[-capacity:]
+            self._ecgHead = 0
+            self._ecgCount = capacity
+            return
+        
+        head = self._ecgHead
+        firstPart = min(count, capacity - head)
+        self._ecgRing[head:head + firstPart] = samples[:firstPart]
+        self._ecgRing[:count - firstPart] = samples[firstPart:]
+        
+        self._ecgHead = (head + count) % capacity
+        self._ecgCount = min(self._ecgCount + count, capacity)
+    
     def validateValue(self, value: Any) -> bool:
         """Valida valores de ECG ou HR"""
         
@@ -167,10 +212,11 @@ class CardiacSignal(BaseSignal):
         if not ecgPoints:
             return anomalies
         
-        latestEcg = np.array(ecgPoints[-1].value)
+        # asarray evita copiar quando o ponto já guarda um ndarray
+        latestEcg = np.asarray(ecgPoints[-1].value)
         
         # Amplitude muito baixa (eletrodo solto?)
-        amplitude = np.max(latestEcg) - np.min(latestEcg)
+        amplitude = latestEcg.max() - latestEcg.min()
         #if amplitude < self.ecgLowAmplitudeThreshold:
             #anomalies.append(f"Amplitude ECG muito baixa: {amplitude:.3f} mV (possível eletrodo solto/ mau contacto)")  #TODO Averiguar como tornar realiable, quando está num ponto entre waves dá sempre trigger nisto.
         
@@ -179,15 +225,15 @@ class CardiacSignal(BaseSignal):
             anomalies.append(f"Amplitude ECG muito alta: {amplitude:.3f} mV (intereferência elétrica/ saturação)")
         
         # Sinal muito plano (sem variação) provavelmente algum problema na leitura
-        std = np.std(latestEcg)
+        #std = np.std(latestEcg)  # Só calcular quando a verificação abaixo for reativada
         #if std < self.ecgFlatThreshold:
             #anomalies.append(f"Sinal ECG muito plano: std={std:.4f} mV") #TODO Averiguar como tornar realiable, quando está num ponto entre waves dá sempre trigger nisto.
         
         # Baseline drift (comparar com pontos anteriores) , às vezes derivado de pior contacto ao longo do tempo devido a suor ou assim
         if len(ecgPoints) >= 3:
-            previousEcg = np.array(ecgPoints[-3].value)
-            currentBaseline = np.mean(latestEcg)
-            previousBaseline = np.mean(previousEcg)
+            previousEcg = np.asarray(ecgPoints[-3].value)
+            currentBaseline = latestEcg.mean()
+            previousBaseline = previousEcg.mean()
             
             drift = abs(currentBaseline - previousBaseline)
             if drift > self.ecgDriftThreshold:
@@ -198,46 +244,33 @@ class CardiacSignal(BaseSignal):
     # Métodos específicos para CardiacSignal
     
     def getLatestHr(self) -> Optional[float]:
-        """Retorna a última frequência cardíaca"""
-        allPoints = self.getAllData()
-        
-        # Procurar o último ponto de HR (valor único)
-        for point in reversed(allPoints):
-            if isinstance(point.value, (int, float)):
-                return point.value
+        """Retorna a última frequência cardíaca (None se já saiu do buffer)"""
+        if self._latestHr is None or self._pointSequence - self._latestHrSequence >= self.bufferSize:
+            return None
         
-        return None
+        return self._latestHr
     
     def getLatestEcgSegment(self, durationSeconds: float = 5.0) -> Optional[np.ndarray]:
-        """Retorna segmento ECG dos últimos X segundos"""
-        allPoints = self.getAllData()
-        
-        if not allPoints:
+        """Retorna segmento ECG dos últimos X segundos (limitado à capacidade do ring)"""
+        if self._ecgCount == 0:
             return None
         
-        # Calcular quantos pontos representam a duração desejada
-        samplesNeeded = int(durationSeconds * self.samplingRate)
-        
-        # Coletar pontos ECG recentes
-        ecgSamples = []
-        for point in reversed(allPoints):
-            if isinstance(point.value, (list, np.ndarray)):
-                ecgSamples.extend(point.value)
-                if len(ecgSamples) >= samplesNeeded:
-                    break
+        # Calcular quantos samples representam a duração desejada
+        samplesNeeded = min(int(durationSeconds * self.samplingRate), self._ecgCount)
         
-        if not ecgSamples:
-            return None
+        # Ler os últimos N samples em ordem cronológica
+        start = (self._ecgHead - samplesNeeded) % self.ecgRingCapacity
+        if start + samplesNeeded <= self.ecgRingCapacity:
+            return self._ecgRing[start:start + samplesNeeded].copy()
         
-        # Retornar os últimos N samples
-        return np.array(ecgSamples[-samplesNeeded:])
+        return np.concatenate((self._ecgRing[start:], self._ecgRing[:self._ecgHead]))
     
     def calculateHrStatistics(self, lastMinutes: int = 5) -> Optional[dict]:
         """Calcula estatísticas de HR dos últimos X minutos"""
         allPoints = self.getAllData()
         
         # Filtrar pontos de HR dos últimos X minutos
-        cutoffTime = datetime.now().timestamp() - (lastMinutes * 60)
+        cutoffTime = time.time() - (lastMinutes * 60)
         hrValues = []
         
         for point in allPoints:
@@ -264,7 +297,8 @@ class CardiacSignal(BaseSignal):
     
     def _countInRange(self, values: List[float], range_tuple: tuple) -> dict:
         """Conta quantos valores estão dentro do range normal"""
-        inRange = sum(1 for value in values if range_tuple[0] <= value <= range_tuple[1])
+        valuesArray = np.asarray(values, dtype=float)
+        inRange = int(np.count_nonzero((valuesArray >= range_tuple[0]) & (valuesArray <= range_tuple[1])))
         total = len(values)
         
         return {
@@ -324,6 +358,15 @@ class CardiacSignal(BaseSignal):
         
         return cardiacStatus
     
+    def reset(self) -> None:
+        """Reset completo do sinal, incluindo ring ECG e último HR"""
+        super().reset()
+        self._ecgHead = 0
+        self._ecgCount = 0
+        self._pointSequence = 0
+        self._latestHr = None
+        self._latestHrSequence = 0
+    
     def _classifyHr(self, hr: float) -> str:
         """Classifica frequência cardíaca"""
         if hr < self.bradycardiaTreshold:
@@ -22,9 +22,9 @@ A classe mantém um buffer circular de 30.000 pontos (30 segundos de dados de 4
 Foi feita com o objectivo de suportar qualquer fonte de dados EEG, desde que enviem os 4 canais raw e as 5 power bands no formato esperado.
 """
 
+import time
 import numpy as np
 from typing import List, Optional, Any, Dict, Union
-from datetime import datetime
 
 from ..base import BaseSignal
 from ..dataPoint import SignalPoint
@@ -220,40 +220,36 @@ class EEGSignal(BaseSignal):
         
         latestEeg = rawPoints[-1].value
         
+        # Estatísticas de todos os canais calculadas de uma vez (uma linha por canal)
+        channels = [channel for channel in self.channelNames if channel in latestEeg]
+        saturated, channelStds, maxAmplitudes, baselines = self._channelStatistics(
+            [latestEeg[channel] for channel in channels]
+        )
+        
         # Verificar cada canal
-        for channel in self.channelNames:
-            if channel not in latestEeg:
-                continue
-                
-            channelData = np.array(latestEeg[channel])
-            
+        for i, channel in enumerate(channels):
             # Saturação (amplitude constante no máximo)
-            if np.all(np.abs(channelData) > self.saturationThreshold):
+            if saturated[i]:
                 anomalies.append(f"Saturação detectada no {channel}")
             
             # Sinal muito plano (eletrodo solto ou mal contato geral)
-            std = np.std(channelData)
+            std = channelStds[i]
             if std < self.minChannelStd:  # μV - muito baixo para EEG ativo
                 anomalies.append(f"Eletrodo possivelmente solto no {channel}: std={std:.3f}μV")
             
             # Provalvelmnete causado pelo movimento (amplitude muito alta)
-            maxAmplitude = np.max(np.abs(channelData))
+            maxAmplitude = maxAmplitudes[i]
             if maxAmplitude > self.maxChannelAmplitude:  # μV
                 anomalies.append(f"Possível movimento brusco do sujeito {channel}: {maxAmplitude:.1f}μV")
             
             # Deriva DC (baseline drift)
-            baseline = np.mean(channelData)
+            baseline = baselines[i]
             if abs(baseline) > self.maxBaselineDrift:  # μV
                 anomalies.append(f"Deriva DC detectada no {channel}: {baseline:.1f}μV")
         
         # Anomalias entre canais
         if len(self.channelNames) == self.channelCount:
             # Verificar se algum canal está muito diferente dos outros
-            channelStds = []
-            for channel in self.channelNames:
-                if channel in latestEeg:
-                    channelStds.append(np.std(latestEeg[channel]))
-            
             if len(channelStds) >= 3:
                 meanStd = np.mean(channelStds)
                 for i, std in enumerate(channelStds):
@@ -262,6 +258,43 @@ class EEGSignal(BaseSignal):
         
         return anomalies
     
+    def _channelStatistics(self, channelValues: List[Any]) -> tuple:
+        """
+        Calcula saturação, desvio padrão, amplitude máxima e média de cada canal.
+        
+        Canais com o mesmo número de amostras (caso normal) são empilhados numa matriz
+        e reduzidos por eixo; caso contrário calcula canal a canal.
+        
+        Args:
+            channelValues: Amostras de cada canal
+            
+        Returns:
+            Tuplo (saturated, stds, maxAmplitudes, baselines) com um valor por canal
+        """
+        
+        if not channelValues:
+            return [], [], [], []
+        
+        channelArrays = [np.asarray(values) for values in channelValues]
+        
+        if len({len(values) for values in channelArrays}) == 1:
+            block = np.vstack(channelArrays)
+            absBlock = np.abs(block)
+            return (
+                np.all(absBlock > self.saturationThreshold, axis=1),
+                block.std(axis=1),
+                absBlock.max(axis=1),
+                block.mean(axis=1)
+            )
+        
+        absArrays = [np.abs(values) for values in channelArrays]
+        return (
+            [np.all(absValues > self.saturationThreshold) for absValues in absArrays],
+            [np.std(values) for values in channelArrays],
+            [np.max(absValues) for absValues in absArrays],
+            [np.mean(values) for values in channelArrays]
+        )
+    
     def _detectPowerBandAnomalies(self, bandPoints: List[SignalPoint]) -> List[str]:
         """Detecta anomalias nas power bands"""
         anomalies = []
@@ -352,7 +385,7 @@ class EEGSignal(BaseSignal):
         allPoints = self.getAllData()
         
         # Coletar dados do canal dos últimos X segundos
-        cutoffTime = datetime.now().timestamp() - durationSeconds
+        cutoffTime = time.time() - durationSeconds
         channelSamples = []
         
         for point in allPoints:
@@ -24,6 +24,7 @@ automaticamente padrões de condução do condutor. Foi feita para suportar qual
 dados de movimento, desde que enviem os 3 eixos de aceleração e rotação no formato esperado.
 """
 
+import time
 import numpy as np
 from typing import List, Optional, Any, Dict, Union
 from datetime import datetime
@@ -458,7 +459,7 @@ class SensorsSignal(BaseSignal):
         allPoints = self.getAllData()
         
         # Filtrar pontos do tipo de sensor e período desejado
-        cutoffTime = datetime.now().timestamp() - durationSeconds
+        cutoffTime = time.time() - durationSeconds
         relevantPoints = []
         
         for point in allPoints:
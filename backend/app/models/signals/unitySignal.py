@@ -19,6 +19,7 @@ getDrivingQuality() que avalia qualidade geral da condução baseada na combina
 de todos os fatores, e getUnityStatus() que fornece resumo completo do estado.
 """
 
+import time
 import numpy as np
 from typing import List, Optional, Any, Dict, Union
 from datetime import datetime
@@ -328,7 +329,7 @@ class UnitySignal(BaseSignal):
         allPoints = self.getAllData()
         
         # Filtrar pontos de álcool recentes
-        cutoffTime = datetime.now().timestamp() - durationSeconds
+        cutoffTime = time.time() - durationSeconds
         alcoholPoints = []
         
         for point in allPoints:
@@ -341,6 +342,8 @@ class UnitySignal(BaseSignal):
             return None
         
         alcoholArray = np.array(alcoholPoints)
+        # Contagem única reutilizada para o total e a percentagem
+        timesAboveLegal = int(np.count_nonzero(alcoholArray > self.legalLimit))
         
         return {
             "duration": durationSeconds,
@@ -351,8 +354,8 @@ class UnitySignal(BaseSignal):
             "max": float(np.max(alcoholArray)),
             "current": alcoholPoints[-1],
             "trend": "increasing" if len(alcoholPoints) >= 2 and alcoholPoints[-1] > alcoholPoints[-2] else "stable_or_decreasing",
-            "timesAboveLegal": sum(1 for level in alcoholPoints if level > self.legalLimit),
-            "percentageAboveLegal": (sum(1 for level in alcoholPoints if level > self.legalLimit) / len(alcoholPoints)) * 100,
+            "timesAboveLegal": timesAboveLegal,
+            "percentageAboveLegal": (timesAboveLegal / len(alcoholPoints)) * 100,
             "units": "g/L"
         }
     
@@ -361,7 +364,7 @@ class UnitySignal(BaseSignal):
         allPoints = self.getAllData()
         
         # Filtrar pontos de velocidade recentes
-        cutoffTime = datetime.now().timestamp() - durationSeconds
+        cutoffTime = time.time() - durationSeconds
         speedPoints = []
         
         for point in allPoints:
@@ -374,6 +377,8 @@ class UnitySignal(BaseSignal):
             return None
         
         speedArray = np.array(speedPoints)
+        # Contagem única reutilizada para o total e a percentagem
+        timesSpeeding = int(np.count_nonzero(speedArray > self.speedingThreshold))
         
         return {
             "duration": durationSeconds,
@@ -383,9 +388,9 @@ class UnitySignal(BaseSignal):
             "min": float(np.min(speedArray)),
             "max": float(np.max(speedArray)),
             "current": speedPoints[-1],
-            "timesSpeeding": sum(1 for speed in speedPoints if speed > self.speedingThreshold),
-            "percentageSpeeding": (sum(1 for speed in speedPoints if speed > self.speedingThreshold) / len(speedPoints)) * 100,
-            "avgSpeedChange": float(np.mean([abs(speedPoints[i] - speedPoints[i-1]) for i in range(1, len(speedPoints))])),
+            "timesSpeeding": timesSpeeding,
+            "percentageSpeeding": (timesSpeeding / len(speedPoints)) * 100,
+            "avgSpeedChange": float(np.mean(np.abs(np.diff(speedArray)))),
             "units": "km/h"
         }
     
@@ -11,6 +11,8 @@ por signal types individuais.
 """
 
 import logging
+import re
+import time
 from typing import Dict, List, Optional, Any, Set
 from datetime import datetime
 
@@ -23,6 +25,28 @@ from ..models.base import SignalPoint
 from ..core import eventManager, settings
 from ..core.signalControl import SignalControlInterface, SignalState, ComponentState, signalControlManager
 
+# Palavras-chave de severidade (procura por substring na mensagem em minúsculas),
+# compiladas uma vez numa única alternância em vez de percorridas a cada anomalia
+_CRITICAL_KEYWORDS = (
+    "severe", "crítico", "crítica", "saturação", "solto", "muito baixa", "muito alta",
+    "error", "failed", "connection", "timeout", "impacto", "spin", "derrapagem",
+    "emergência", "travagem", "sonolência crítica", "confiança baixa", "qualidade alta",
+    "perigo crítico", "álcool perigoso", "velocidade muito perigosa", "fora da faixa",
+    "nível de álcool perigoso"
+)
+
+_WARNING_KEYWORDS = (
+    "moderate", "moderada", "alta", "súbita", "dominância", "excessiva", "warning",
+    "drift", "artefacto", "movimento", "variabilidade", "brusco", "rápida",
+    "agressiva", "vibração", "rotação", "instabilidade", "sonolência moderada",
+    "piscadelas baixa", "piscadelas excessiva", "olhar desviado", "errático",
+    "qualidade moderada", "álcool acima", "excesso de velocidade", "próximo da saída", "condução perigosa",
+    "condução instável", "mudança súbita", "aumento súbito"
+)
+
+_CRITICAL_PATTERN = re.compile("|".join(map(re.escape, _CRITICAL_KEYWORDS)))
+_WARNING_PATTERN = re.compile("|".join(map(re.escape, _WARNING_KEYWORDS)))
+
 class SignalManager(SignalControlInterface):
     """Manager central para coordenar sinais com controlo de sinais"""
     
@@ -152,7 +176,7 @@ class SignalManager(SignalControlInterface):
         try:
             # Criar SignalPoint
             point = SignalPoint(
-                timestamp=timestamp or datetime.now().timestamp(),
+                timestamp=timestamp or time.time(),
                 value=value,
                 quality=1.0,  # Por agora qualidade fixa
                 metadata={"dataType": dataType, "source": "signal_manager"}
@@ -175,7 +199,7 @@ class SignalManager(SignalControlInterface):
                 self.stats["dataProcessedBySignal"][signalType] += 1
                 self.stats["lastProcessedTime"] = datetime.now().isoformat()
                 
-                self.logger.debug(f"Added {dataType} data to {signalType}")
+                self.logger.debug("Added %s data to %s", dataType, signalType)
                 
                 # Emitir evento normal (sempre)
                 await eventManager.emit("signal.processed", {
@@ -260,7 +284,7 @@ class SignalManager(SignalControlInterface):
                 self.stats["totalErrors"] += 1
                 return False
             
-            self.logger.debug(f"Processing ZeroMQ data from {source} with keys: {list(data.keys())}")
+            self.logger.debug("Processing ZeroMQ data from %s with keys: %s", source, list(data))
             
             overallSuccess = True
             processedCount = 0
@@ -323,7 +347,7 @@ class SignalManager(SignalControlInterface):
                         
             # Verificar se processamos alguma coisa
             if processedCount > 0:
-                self.logger.debug(f"Successfully processed {processedCount} signal types from {source}")
+                self.logger.debug("Successfully processed %d signal types from %s", processedCount, source)
             else:
                 self.logger.warning(f"No recognizable data types in message from {source}. Available keys: {list(data.keys())}")
                 overallSuccess = False
@@ -849,24 +873,11 @@ class SignalManager(SignalControlInterface):
         message = anomalyMessage.lower()
         
         # Crítico
-        if any(word in message for word in [
-            "severe", "crítico", "crítica", "saturação", "solto", "muito baixa", "muito alta",
-            "error", "failed", "connection", "timeout", "impacto", "spin", "derrapagem",
-            "emergência", "travagem", "sonolência crítica", "confiança baixa", "qualidade alta",
-            "perigo crítico", "álcool perigoso", "velocidade muito perigosa", "fora da faixa",
-            "nível de álcool perigoso"
-        ]):
+        if _CRITICAL_PATTERN.search(message):
             return "critical"
         
         # Aviso
-        elif any(word in message for word in [
-            "moderate", "moderada", "alta", "súbita", "dominância", "excessiva", "warning",
-            "drift", "artefacto", "movimento", "variabilidade", "brusco", "rápida",
-            "agressiva", "vibração", "rotação", "instabilidade", "sonolência moderada",
-            "piscadelas baixa", "piscadelas excessiva", "olhar desviado", "errático",
-            "qualidade moderada", "álcool acima", "excesso de velocidade", "próximo da saída", "condução perigosa",
-            "condução instável", "mudança súbita", "aumento súbito"
-        ]):
+        elif _WARNING_PATTERN.search(message):
             return "warning"
         
         # Info
@@ -260,23 +260,24 @@ class ZeroMQListener(SignalControlInterface):
         self.state = ListenerState.STOPPED
         
         try:
-            # Cancelar tasks de processamento
-            if self.listenerTask and not self.listenerTask.done():
-                self.listenerTask.cancel()
-                try:
-                    await self.listenerTask
-                except asyncio.CancelledError:
-                    pass
+            # Cancelar tasks de processamento (independentes: aguardadas em conjunto)
+            pendingTasks = {
+                name: task for name, task in (("listener", self.listenerTask), ("heartbeat", self.heartbeatTask))
+                if task and not task.done()
+            }
+            for task in pendingTasks.values():
+                task.cancel()
+            
+            results = await asyncio.gather(*pendingTasks.values(), return_exceptions=True)
             
-            if self.heartbeatTask and not self.heartbeatTask.done():
-                self.heartbeatTask.cancel()
-                try:
-                    await self.heartbeatTask
-                except asyncio.CancelledError:
-                    pass
+            # Registar erros reais das tasks (o cancelamento é o resultado esperado)
+            for name, result in zip(pendingTasks, results):
+                if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError):
+                    self.logger.error(f"Error in {name} task while stopping ZeroMQ listener: {result}")
             
-            # Fechar conexão ZeroMQ
+            # Fechar conexão ZeroMQ e terminar contexto
             await self._disconnect()
+            self._terminateContext()
             
             # Emitir evento de paragem com estatísticas
             await eventManager.emit("zmq.listener_stopped", {
@@ -304,8 +305,9 @@ class ZeroMQListener(SignalControlInterface):
         try:
             self.state = ListenerState.CONNECTING
             
-            # Criar contexto e socket ZeroMQ
-            self.context = zmq.asyncio.Context()
+            # Criar contexto (reutilizado entre reconexões) e socket ZeroMQ
+            if self.context is None:
+                self.context = zmq.asyncio.Context()
             self.socket = self.context.socket(zmq.SUB)
             
             # Configurar parâmetros do socket
@@ -368,7 +370,9 @@ class ZeroMQListener(SignalControlInterface):
     
     async def _disconnect(self):
         """
-        Fecha socket e termina contexto ZeroMQ de forma segura.
+        Fecha socket ZeroMQ de forma segura.
+        
+        O contexto é mantido para reconexões; só é terminado em stop().
         """
         try:
             if self.socket:
@@ -382,10 +386,6 @@ class ZeroMQListener(SignalControlInterface):
                 self.socket.close()
                 self.socket = None
             
-            if self.context:
-                self.context.term()
-                self.context = None
-            
             self.subscribedTopics.clear()
             self.logger.debug(f"ZeroMQ SUB socket closed")
             
@@ -393,6 +393,19 @@ class ZeroMQListener(SignalControlInterface):
             self.logger.error(f"Error closing ZeroMQ socket: {e}")
             self.stats["errors"] += 1
     
+    def _terminateContext(self):
+        """
+        Termina o contexto ZeroMQ (threads de IO). Chamar apenas depois de fechar o socket.
+        """
+        try:
+            if self.context:
+                self.context.term()
+                self.context = None
+                
+        except Exception as e:
+            self.logger.error(f"Error terminating ZeroMQ context: {e}")
+            self.stats["errors"] += 1
+    
     async def _messageLoop(self):
         """
         Loop principal de recepção e processamento de mensagens.
@@ -423,9 +436,9 @@ class ZeroMQListener(SignalControlInterface):
         descodifica dados msgpack e delega processamento ao ZeroMQProcessor.
         """
         try:
-            # Aguardar mensagem multipart com timeout
+            # Aguardar mensagem multipart com timeout (acordado pelo socket, sem polling)
             multiPartMsg = await asyncio.wait_for(
-                self.socket.recv_multipart(zmq.NOBLOCK),
+                self.socket.recv_multipart(),
                 timeout=self.timeout / 1000.0
             )
             
@@ -465,14 +478,10 @@ class ZeroMQListener(SignalControlInterface):
                     (currentAvg * (processedCount - 1) + processingTime) / processedCount
                 )
             
-        except asyncio.TimeoutError:
-            # Timeout esperado - verificar se não há mensagens há muito tempo
+        except (asyncio.TimeoutError, zmq.Again):
+            # Timeout esperado (wait_for ou RCVTIMEO) - verificar se não há mensagens há muito tempo
             await self._checkMessageTimeout()
             
-        except zmq.Again:
-            # Não há mensagens disponíveis no momento
-            await asyncio.sleep(0.01)
-            
         except Exception as e:
             self.logger.error(f"Error receiving message: {e}")
             self.stats["errors"] += 1
@@ -532,15 +541,16 @@ class ZeroMQListener(SignalControlInterface):
                     self.stats["topicStats"][topic]["rejected"] += 1
                 self.logger.warning(f"Message rejected by SignalManager from topic {topic}")
             
-            # Emitir evento de mensagem recebida
-            await eventManager.emit("zmq.message_received", {
-                "timestamp": datetime.now().isoformat(),
-                "topic": topic,
-                "dataType": dataType,
-                "signalType": processedData.get("signalType"),
-                "processed": success,
-                "messageSize": len(rawData)
-            })
+            # Emitir evento de mensagem recebida (só constrói o payload se houver listeners)
+            if eventManager.hasListeners("zmq.message_received"):
+                await eventManager.emit("zmq.message_received", {
+                    "timestamp": datetime.now().isoformat(),
+                    "topic": topic,
+                    "dataType": dataType,
+                    "signalType": processedData.get("signalType"),
+                    "processed": success,
+                    "messageSize": len(rawData)
+                })
             
         except Exception as e:
             self.stats["messagesRejected"] += 1
@@ -33,6 +33,7 @@ FORMATO DOS DADOS ZEROMQ:
 import json
 import logging
 import msgpack
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Union, Set
 import numpy as np
@@ -41,6 +42,60 @@ from ..core import settings, eventManager
 from ..core.exceptions import ZeroMQProcessingError, TopicValidationError, UnknownTopicError
 from ..core.signalControl import SignalControlInterface, SignalState, ComponentState, signalControlManager  
 
+def _decodeNumpyExt(code: int, data: bytes) -> Any:
+    """
+    Hook do unpacker msgpack: reconstrói arrays NumPy enviados como ExtType.
+    
+    Devolve listas para que a validação e o processamento por tópico recebam
+    o mesmo formato que os sensores reais enviam.
+    
+    Args:
+        code: Código do ExtType
+        data: Payload do ExtType
+        
+    Returns:
+        Lista de listas com os valores do array, ou o ExtType original se código desconhecido
+    """
+    
+    if code != settings.zeromq.numpyExtType:
+        return msgpack.ExtType(code, data)
+    
+    meta = msgpack.unpackb(data, raw=False)
+    array = np.frombuffer(meta["data"], dtype=np.dtype(meta["dtype"])).reshape(meta["shape"])
+    return array.tolist()
+
+def _roundList(values: np.ndarray, ndigits: int) -> List[float]:
+    """
+    Converte array para lista arredondada com round() do Python.
+    
+    Mantém o arredondamento decimal exato do formato de saída (np.round pode
+    divergir em casos de empate).
+    
+    Args:
+        values: Array de valores
+        ndigits: Casas decimais
+        
+    Returns:
+        Lista de floats arredondados
+    """
+    
+    return [round(value, ndigits) for value in values.tolist()]
+
+def _sampleTimestamps(timestamp: float, sampleCount: int, increment: float) -> List[float]:
+    """
+    Gera timestamps por amostra (timestamp + i * increment) de forma vetorizada.
+    
+    Args:
+        timestamp: Timestamp da primeira amostra
+        sampleCount: Número de amostras
+        increment: Intervalo entre amostras (s)
+        
+    Returns:
+        Lista de timestamps
+    """
+    
+    return (timestamp + np.arange(sampleCount) * increment).tolist()
+
 class ZeroMQProcessor(SignalControlInterface):
     """Processador de dados ZeroMQ para conversão e formatação com controlo de sinais"""
     
@@ -53,6 +108,12 @@ class ZeroMQProcessor(SignalControlInterface):
         self.processingConfig = zmqConfig.topicProcessingConfig  
         self.validationConfig = zmqConfig.topicValidationConfig
         
+        # Campos obrigatórios pré-calculados por tópico (verificação de subconjunto numa só chamada)
+        self.requiredFieldSets = {
+            topic: frozenset(config.get("requiredFields", []))
+            for topic, config in self.validationConfig.items()
+        }
+        
         # Signal Control properties
         self.availableSignals = settings.signalControl.zeroMQTopics.copy()
         defaultActiveStates = settings.signalControl.defaultActiveStates["processor"]
@@ -158,7 +219,7 @@ class ZeroMQProcessor(SignalControlInterface):
             
             # Descodificar dados msgpack
             try:
-                decodedData = msgpack.unpackb(rawData, raw=False)
+                decodedData = msgpack.unpackb(rawData, raw=False, ext_hook=_decodeNumpyExt)
                 self.logger.debug(f"Successfully decoded msgpack data for {topic}")
             except Exception as e:
                 raise ZeroMQProcessingError(
@@ -180,22 +241,23 @@ class ZeroMQProcessor(SignalControlInterface):
                 # Atualizar estatísticas de sucesso
                 self.processingStats["totalProcessed"] += 1
                 self.processingStats["byTopic"][topic]["processed"] += 1
-                self.processingStats["byTopic"][topic]["lastProcessed"] = datetime.now().isoformat()
+                self.processingStats["byTopic"][topic]["lastProcessed"] = time.time()  # Convertido para ISO em getProcessingStats()
                 
                 # Calcular tempo de processamento
                 processingTime = (datetime.now() - startTime).total_seconds()
                 
                 self.logger.debug(f"Successfully processed {topic} data in {processingTime:.3f}s")
                 
-                # Emitir evento de processamento bem-sucedido
-                await eventManager.emit("zmq.data_processed", {
-                    "topic": topic,
-                    "processingTime": processingTime,
-                    "dataSize": len(rawData),
-                    "outputSignalType": processedData.get("signalType"),
-                    "outputDataType": processedData.get("dataType"),
-                    "timestamp": datetime.now().isoformat()
-                })
+                # Emitir evento de processamento bem-sucedido (só constrói o payload se houver listeners)
+                if eventManager.hasListeners("zmq.data_processed"):
+                    await eventManager.emit("zmq.data_processed", {
+                        "topic": topic,
+                        "processingTime": processingTime,
+                        "dataSize": len(rawData),
+                        "outputSignalType": processedData.get("signalType"),
+                        "outputDataType": processedData.get("dataType"),
+                        "timestamp": datetime.now().isoformat()
+                    })
                 
                 return processedData
             else:
@@ -250,7 +312,8 @@ class ZeroMQProcessor(SignalControlInterface):
                     expectedRange=("valid_json",)
                 )
         
-        self.logger.debug(f"Validating data structure for {topic}: {data}")
+        # Formatação lazy: o payload já descodificado só é convertido em texto se DEBUG estiver ativo
+        self.logger.debug("Validating data structure for %s: %s", topic, data)
         
         # Verificar se dados são um dicionário
         if not isinstance(data, dict):
@@ -263,14 +326,16 @@ class ZeroMQProcessor(SignalControlInterface):
         
         # Verificar campos obrigatórios (ts, labels, data)
         requiredFields = config.get("requiredFields", [])
-        for field in requiredFields:
-            if field not in data:
-                raise TopicValidationError(
-                    topic=topic,
-                    field=field,
-                    value="missing",
-                    expectedRange=("required",)
-                )
+        if not self.requiredFieldSets[topic].issubset(data):
+            # Só percorre campo a campo para identificar o primeiro em falta
+            for field in requiredFields:
+                if field not in data:
+                    raise TopicValidationError(
+                        topic=topic,
+                        field=field,
+                        value="missing",
+                        expectedRange=("required",)
+                    )
         
         # Validar estrutura específica do novo formato
         if "labels" in requiredFields and "data" in requiredFields:
@@ -308,16 +373,18 @@ class ZeroMQProcessor(SignalControlInterface):
                 if len(dataArray) > 0 and isinstance(dataArray[0], list):
                     # Verificar se cada linha de dados tem o mesmo número de elementos que labels
                     expectedColumns = len(labelsArray)
-                    for i, row in enumerate(dataArray):
-                        if len(row) != expectedColumns:
-                            raise TopicValidationError(
-                                topic=topic,
-                                field=f"data_row_{i}",
-                                value=f"length_{len(row)}",
-                                expectedRange=(f"length_{expectedColumns}",)
-                            )
-        
-        self.logger.debug(f"Data validation passed for topic {topic}")
+                    if set(map(len, dataArray)) != {expectedColumns}:
+                        # Caso raro: localizar a primeira linha inválida para o erro
+                        for i, row in enumerate(dataArray):
+                            if len(row) != expectedColumns:
+                                raise TopicValidationError(
+                                    topic=topic,
+                                    field=f"data_row_{i}",
+                                    value=f"length_{len(row)}",
+                                    expectedRange=(f"length_{expectedColumns}",)
+                                )
+        
+        self.logger.debug("Data validation passed for topic %s", topic)
 
         return data
     
@@ -432,15 +499,9 @@ class ZeroMQProcessor(SignalControlInterface):
                     # Landmarks são array flattened [x1,y1,z1,x2,y2,z2,...]
                     landmarksFlat = firstRow[i]
                     if isinstance(landmarksFlat, list) and len(landmarksFlat) == 1434:  # 478 * 3
-                        # Reshape para [[x1,y1,z1], [x2,y2,z2], ...]
-                        landmarks = []
-                        for j in range(0, len(landmarksFlat), 3):
-                            landmarks.append([
-                                landmarksFlat[j],      # x
-                                landmarksFlat[j+1],    # y
-                                landmarksFlat[j+2]     # z
-                            ])
-                        processedData["landmarks"] = landmarks
+                        # Reshape para [[x1,y1,z1], [x2,y2,z2], ...] agrupando o mesmo iterador 3 a 3 (x, y, z)
+                        flatIter = iter(landmarksFlat)
+                        processedData["landmarks"] = list(map(list, zip(flatIter, flatIter, flatIter)))
                     else:
                         self.logger.warning(f"Invalid landmarks length: expected 1434, got {len(landmarksFlat) if isinstance(landmarksFlat, list) else 'not list'}")
                         return None
@@ -627,16 +688,20 @@ class ZeroMQProcessor(SignalControlInterface):
                     rawData=data
                 )
             
-            # Extrair valores ECG e LOD
-            ecgRawValues = []
-            lodValues = []
+            # Cada amostra tem de ser uma linha [ECG, LOD, ...] (a validação só verifica
+            # comprimentos quando a primeira linha é uma lista)
+            if dataArray and not isinstance(dataArray[0], list):
+                raise ZeroMQProcessingError(
+                    topic="CardioWheel_ECG",
+                    operation="ecg_extraction",
+                    reason=f"Data rows must be lists, got {type(dataArray[0]).__name__}",
+                    rawData=data
+                )
             
-            for row in dataArray:
-                if len(row) > ecgIndex:
-                    ecgRawValues.append(row[ecgIndex])
-                
-                if lodIndex is not None and len(row) > lodIndex:
-                    lodValues.append(row[lodIndex])
+            # Extrair colunas ECG e LOD das linhas originais (mantém os tipos, e.g. LOD inteiro)
+            ecgRawValues = [row[ecgIndex] for row in dataArray]
+            lodValues = [row[lodIndex] for row in dataArray] if lodIndex is not None else []
+            ecgColumn = np.asarray(ecgRawValues, dtype=float)
             
             self.logger.debug(f"Extracted {len(ecgRawValues)} ECG raw values, range: {min(ecgRawValues) if ecgRawValues else 'N/A'} to {max(ecgRawValues) if ecgRawValues else 'N/A'}")
             
@@ -644,18 +709,15 @@ class ZeroMQProcessor(SignalControlInterface):
             conversionFactor = 5.0 / 32768.0  # mV por ADC unit
             baselineOffset = 1650  # Valor baseline típico observado nos dados
             
-            ecgMillivolts = []
-            for rawValue in ecgRawValues:
-                # Remover offset baseline e converter para mV
-                adjustedValue = rawValue - baselineOffset
-                millivolts = adjustedValue * conversionFactor
-                ecgMillivolts.append(round(millivolts, 3))
+            # Remover offset baseline e converter para mV (vetorizado sobre o chunk inteiro;
+            # arredondamento com round() do Python, como ACC/GYR)
+            ecgMillivolts = _roundList((ecgColumn - baselineOffset) * conversionFactor, 3)
             
             self.logger.debug(f"Converted ECG to mV: range {min(ecgMillivolts) if ecgMillivolts else 'N/A'} to {max(ecgMillivolts) if ecgMillivolts else 'N/A'}")
             
             # Gerar timestamps para cada amostra
             timestampIncrement = config["timestampIncrement"]
-            timestamps = [timestamp + (i * timestampIncrement) for i in range(len(ecgMillivolts))]
+            timestamps = _sampleTimestamps(timestamp, len(ecgMillivolts), timestampIncrement)
             
             # Preparar dados de saída
             outputData = {
@@ -678,6 +740,10 @@ class ZeroMQProcessor(SignalControlInterface):
                 outputData["data"]["lod"] = lodValues
             
             return outputData
+        
+        except ZeroMQProcessingError:
+            # Reenviar erros já específicos (label_mapping, ecg_extraction) sem voltar a embrulhar
+            raise
             
         except Exception as e:
             raise ZeroMQProcessingError(
@@ -804,56 +870,45 @@ class ZeroMQProcessor(SignalControlInterface):
             conversionFactor = sensorsConfig["conversionFactor"]  # m/s² por ADC unit
             baselineOffset = sensorsConfig["baselineOffset"]
             
+            # Amostras como array (linhas já validadas com o mesmo comprimento que labels)
+            samples = np.asarray(dataArray)
+            sampleCount = len(dataArray)
+            physicalColumns = {}
+            
             for axis in expectedAxes:
                 if axis in labelMap:
                     axisIndex = labelMap[axis]
-                    rawValues = []
-                    physicalValues = []
                     
                     # Extrair valores para este eixo de todas as amostras
-                    for row in dataArray:
-                        if len(row) > axisIndex:
-                            rawValue = row[axisIndex]
-                            rawValues.append(rawValue)
-                            
-                            # Converter para m/s²
-                            if axis.upper() == 'X':
-                                adjustedValue = rawValue - 7500  # Baseline observado em X
-                            elif axis.upper() == 'Y':
-                                adjustedValue = rawValue - 0     # Y já centrado em zero
-                            elif axis.upper() == 'Z':
-                                adjustedValue = rawValue - 3100  # Z baseline (inclui gravidade)
-                            else:
-                                adjustedValue = rawValue - baselineOffset
-                            
-                            physicalValue = adjustedValue * conversionFactor
-                            physicalValues.append(round(physicalValue, 2))
+                    rawColumn = samples[:, axisIndex] if samples.ndim == 2 else np.empty(0, dtype=np.int64)
+                    
+                    # Converter para m/s²
+                    if axis.upper() == 'X':
+                        axisOffset = 7500  # Baseline observado em X
+                    elif axis.upper() == 'Y':
+                        axisOffset = 0     # Y já centrado em zero
+                    elif axis.upper() == 'Z':
+                        axisOffset = 3100  # Z baseline (inclui gravidade)
+                    else:
+                        axisOffset = baselineOffset
+                    
+                    rawValues = rawColumn.tolist()
+                    physicalValues = _roundList((rawColumn - axisOffset) * conversionFactor, 2)
                     
                     accelerometerRaw[axis.lower()] = rawValues
                     accelerometerPhysical[axis.lower()] = physicalValues
+                    physicalColumns[axis.lower()] = np.asarray(physicalValues, dtype=np.float64)
                     
                     self.logger.debug(f"ACC {axis}: raw range [{min(rawValues)}, {max(rawValues)}] -> physical range [{min(physicalValues):.2f}, {max(physicalValues):.2f}] m/s²")
                 else:
                     self.logger.warning(f"Expected accelerometer axis '{axis}' not found in labels {labels}")
             
-            # Calcular magnitude total para cada amostra
-            magnitudes = []
-            sampleCount = len(dataArray)
-            
-            for i in range(sampleCount):
-                try:
-                    x = accelerometerPhysical['x'][i] if 'x' in accelerometerPhysical else 0
-                    y = accelerometerPhysical['y'][i] if 'y' in accelerometerPhysical else 0
-                    z = accelerometerPhysical['z'][i] if 'z' in accelerometerPhysical else 0
-                    
-                    magnitude = (x**2 + y**2 + z**2)**0.5
-                    magnitudes.append(round(magnitude, 2))
-                except (IndexError, KeyError):
-                    magnitudes.append(0.0)
+            # Calcular magnitude total para cada amostra (eixos em falta contam como 0)
+            magnitudes = _roundList(self._vectorMagnitude(physicalColumns, sampleCount), 2)
             
             # Gerar timestamps para cada amostra
             timestampIncrement = 1.0 / config["samplingRate"]  # 1/100Hz = 0.01s
-            timestamps = [timestamp + (i * timestampIncrement) for i in range(sampleCount)]
+            timestamps = _sampleTimestamps(timestamp, sampleCount, timestampIncrement)
             
             self.logger.debug(f"Extracted accelerometer data: {len(accelerometerPhysical)} axes, {sampleCount} samples each, magnitude range: [{min(magnitudes):.2f}, {max(magnitudes):.2f}] m/s²")
             
@@ -924,48 +979,34 @@ class ZeroMQProcessor(SignalControlInterface):
             conversionFactor = sensorsConfig["conversionFactor"]  # °/s por ADC unit
             baselineOffset = sensorsConfig["baselineOffset"]
             
+            # Amostras como array (linhas já validadas com o mesmo comprimento que labels)
+            samples = np.asarray(dataArray)
+            sampleCount = len(dataArray)
+            physicalColumns = {}
+            
             for axis in expectedAxes:
                 if axis in labelMap:
                     axisIndex = labelMap[axis]
-                    rawValues = []
-                    physicalValues = []
                     
-                    # Extrair valores para este eixo de todas as amostras
-                    for row in dataArray:
-                        if len(row) > axisIndex:
-                            rawValue = row[axisIndex]
-                            rawValues.append(rawValue)
-                            
-                            # Converter para °/s
-                            adjustedValue = rawValue - baselineOffset
-                            physicalValue = adjustedValue * conversionFactor
-                            physicalValues.append(round(physicalValue, 1))
+                    # Extrair valores para este eixo de todas as amostras e converter para °/s
+                    rawColumn = samples[:, axisIndex] if samples.ndim == 2 else np.empty(0, dtype=np.int64)
+                    rawValues = rawColumn.tolist()
+                    physicalValues = _roundList((rawColumn - baselineOffset) * conversionFactor, 1)
                     
                     gyroscopeRaw[axis.lower()] = rawValues
                     gyroscopePhysical[axis.lower()] = physicalValues
+                    physicalColumns[axis.lower()] = np.asarray(physicalValues, dtype=np.float64)
                     
                     self.logger.debug(f"GYR {axis}: raw range [{min(rawValues)}, {max(rawValues)}] -> physical range [{min(physicalValues):.1f}, {max(physicalValues):.1f}] °/s")
                 else:
                     self.logger.warning(f"Expected gyroscope axis '{axis}' not found in labels {labels}")
             
-            # Calcular magnitude angular total para cada amostra
-            angularMagnitudes = []
-            sampleCount = len(dataArray)
-            
-            for i in range(sampleCount):
-                try:
-                    x = gyroscopePhysical['x'][i] if 'x' in gyroscopePhysical else 0
-                    y = gyroscopePhysical['y'][i] if 'y' in gyroscopePhysical else 0
-                    z = gyroscopePhysical['z'][i] if 'z' in gyroscopePhysical else 0
-                    
-                    magnitude = (x**2 + y**2 + z**2)**0.5
-                    angularMagnitudes.append(round(magnitude, 1))
-                except (IndexError, KeyError):
-                    angularMagnitudes.append(0.0)
+            # Calcular magnitude angular total para cada amostra (eixos em falta contam como 0)
+            angularMagnitudes = _roundList(self._vectorMagnitude(physicalColumns, sampleCount), 1)
             
             # Gerar timestamps para cada amostra
             timestampIncrement = 1.0 / config["samplingRate"]  # 1/100Hz = 0.01s
-            timestamps = [timestamp + (i * timestampIncrement) for i in range(sampleCount)]
+            timestamps = _sampleTimestamps(timestamp, sampleCount, timestampIncrement)
             
             # Calcular estatísticas básicas para detecção de padrões
             if gyroscopePhysical:
@@ -1006,6 +1047,26 @@ class ZeroMQProcessor(SignalControlInterface):
                 rawData=data
             )
         
+    @staticmethod
+    def _vectorMagnitude(columns: Dict[str, np.ndarray], sampleCount: int) -> np.ndarray:
+        """
+        Calcula a magnitude |(x, y, z)| por amostra.
+        
+        Args:
+            columns: Colunas por eixo ("x", "y", "z"), já convertidas
+            sampleCount: Número de amostras
+            
+        Returns:
+            Array com a magnitude de cada amostra
+        """
+        
+        sumSquares = np.zeros(sampleCount)
+        for axis in ("x", "y", "z"):
+            if axis in columns:
+                sumSquares += columns[axis] ** 2
+        
+        return np.sqrt(sumSquares)
+        
     async def _processUnityAlcohol(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Processa dados de nível de álcool do Unity.
@@ -1207,7 +1268,7 @@ class ZeroMQProcessor(SignalControlInterface):
             self.logger.debug(f"Processing system control: {data}")
             
             return {
-                "timestamp": datetime.now().timestamp(),
+                "timestamp": time.time(),
                 "source": "system",
                 "signalType": signalMapping["signalType"],
                 "dataType": signalMapping["dataType"],
@@ -1241,7 +1302,7 @@ class ZeroMQProcessor(SignalControlInterface):
             self.logger.debug(f"Processing system timestamp: {data}")
             
             return {
-                "timestamp": datetime.now().timestamp(),
+                "timestamp": time.time(),
                 "source": "system",
                 "signalType": signalMapping["signalType"],
                 "dataType": signalMapping["dataType"],
@@ -1275,7 +1336,7 @@ class ZeroMQProcessor(SignalControlInterface):
             self.logger.debug(f"Processing system config: {data}")
             
             return {
-                "timestamp": datetime.now().timestamp(),
+                "timestamp": time.time(),
                 "source": "system",
                 "signalType": signalMapping["signalType"],
                 "dataType": signalMapping["dataType"],
@@ -1332,7 +1393,13 @@ class ZeroMQProcessor(SignalControlInterface):
                 self.processingStats["totalFiltered"] / 
                 max(1, self.processingStats["totalProcessed"] + self.processingStats["totalErrors"] + self.processingStats["totalFiltered"])
             ),
-            "byTopic": self.processingStats["byTopic"].copy(),
+            "byTopic": {
+                topic: {
+                    **topicStats,
+                    "lastProcessed": datetime.fromtimestamp(topicStats["lastProcessed"]).isoformat() if topicStats["lastProcessed"] else None
+                }
+                for topic, topicStats in self.processingStats["byTopic"].items()
+            },
             "supportedTopics": list(self.topicSignalMapping.keys()),
             "signalControl": {
                 "availableSignals": self.getAvailableSignals(),
@@ -10,9 +10,12 @@ Inclui controlo de sinais através do sistema Signal Control para filtering
 por signal types individuais enviados ao frontend.
 """
 
+import array
 import asyncio
+import json
 import logging
-from typing import Set, Dict, Any, Optional, List
+import time
+from typing import Set, Dict, Any, Optional, List, Union
 from datetime import datetime
 from fastapi import WebSocket
 
@@ -44,6 +47,13 @@ class WebSocketManager(SignalControlInterface):
         defaultActiveStates = settings.signalControl.defaultActiveStates["websocket"]
         self.activeSignals: Set[str] = {signal for signal, active in defaultActiveStates.items() if active}
         
+        # Contadores por signal type em arrays paralelos indexados por _signalTypeIndex
+        # (incremento barato em cada broadcast); o formato dict é materializado em _buildSignalTypeStats()
+        self._signalTypeIndex = {signal: index for index, signal in enumerate(self.availableSignals)}
+        self._sentCounts = array.array('Q', [0] * len(self._signalTypeIndex))
+        self._filteredCounts = array.array('Q', [0] * len(self._signalTypeIndex))
+        self._lastSentTimes = array.array('d', [0.0] * len(self._signalTypeIndex))
+        
         # Estatísticas de WebSocket incluindo filtering
         self.stats = {
             "messagesSent": 0,
@@ -53,11 +63,6 @@ class WebSocketManager(SignalControlInterface):
             "heartbeatsSent": 0,
             "connectionEvents": 0,
             "errors": 0,
-            "bySignalType": {signal: {
-                "sent": 0,
-                "filtered": 0,
-                "lastSent": None
-            } for signal in self.availableSignals},
             "startTime": datetime.now().isoformat()
         }
         
@@ -308,8 +313,9 @@ class WebSocketManager(SignalControlInterface):
         # Filtering via Signal Control por signal type
         if dataType not in self.activeSignals:
             self.stats["messagesFiltered"] += 1
-            if dataType in self.stats["bySignalType"]:
-                self.stats["bySignalType"][dataType]["filtered"] += 1
+            index = self._signalTypeIndex.get(dataType)
+            if index is not None:
+                self._filteredCounts[index] += 1
             self.logger.debug(f"Signal Control: Signal type {dataType} filtered from WebSocket")
             return
         
@@ -327,9 +333,10 @@ class WebSocketManager(SignalControlInterface):
         
         # Atualizar estatísticas
         self.stats["messagesSent"] += 1
-        if dataType in self.stats["bySignalType"]:
-            self.stats["bySignalType"][dataType]["sent"] += 1
-            self.stats["bySignalType"][dataType]["lastSent"] = datetime.now().isoformat()
+        index = self._signalTypeIndex.get(dataType)
+        if index is not None:
+            self._sentCounts[index] += 1
+            self._lastSentTimes[index] = time.time()  # Convertido para ISO em _buildSignalTypeStats()
         
         self.logger.debug(f"Broadcasted signal update: {data['signalType']}.{dataType}")
     
@@ -419,13 +426,21 @@ class WebSocketManager(SignalControlInterface):
         if not self.activeConnections:
             return
         
+        # Serializar uma única vez para todos os clientes
+        try:
+            text = self._encodeMessage(message)
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Failed to serialize broadcast message ({message.get('type')}): {e}")
+            self.stats["errors"] += 1
+            return
+        
         # Lista de conexões a remover (se falharem)
         deadConnections = []
         
         # Enviar para cada cliente em paralelo
         tasks = []
         for websocket in self.activeConnections:
-            tasks.append(self._sendToClient(websocket, message, deadConnections))
+            tasks.append(self._sendToClient(websocket, text, deadConnections))
         
         # Executar todos os envios em paralelo
         await asyncio.gather(*tasks, return_exceptions=True)
@@ -434,11 +449,18 @@ class WebSocketManager(SignalControlInterface):
         for websocket in deadConnections:
             await self.disconnect(websocket, "connection_failed")
     
-    async def _sendToClient(self, websocket: WebSocket, message: Dict[str, Any], 
+    @staticmethod
+    def _encodeMessage(message: Dict[str, Any]) -> str:
+        """Serializa mensagem em JSON com o mesmo formato de WebSocket.send_json"""
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+    
+    async def _sendToClient(self, websocket: WebSocket, message: Union[Dict[str, Any], str], 
                            deadConnections: list = None):
-        """Envia mensagem para um cliente específico"""
+        """Envia mensagem (dict ou JSON já serializado) para um cliente específico"""
         try:
-            await websocket.send_json(message)
+            if not isinstance(message, str):
+                message = self._encodeMessage(message)
+            await websocket.send_text(message)
             
             # Atualizar última atividade
             if websocket in self.connectionData:
@@ -530,12 +552,26 @@ class WebSocketManager(SignalControlInterface):
             "lastUpdate": datetime.now().isoformat()
         }
     
+    def _buildSignalTypeStats(self) -> Dict[str, Dict[str, Any]]:
+        """Materializa as estatísticas por signal type a partir dos arrays de contadores"""
+        bySignalType = {}
+        for signal, index in self._signalTypeIndex.items():
+            lastSent = self._lastSentTimes[index]
+            bySignalType[signal] = {
+                "sent": self._sentCounts[index],
+                "filtered": self._filteredCounts[index],
+                "lastSent": datetime.fromtimestamp(lastSent).isoformat() if lastSent else None
+            }
+        return bySignalType
+    
     def getWebSocketStats(self) -> Dict[str, Any]:
         """Estatísticas completas do WebSocketManager"""
         uptime = (datetime.now() - datetime.fromisoformat(self.stats["startTime"])).total_seconds()
+        bySignalType = self._buildSignalTypeStats()
         
         return {
             **self.stats,
+            "bySignalType": bySignalType,
             "uptime": uptime,
             "averageMessageRate": self.stats["messagesSent"] / max(1, uptime),
             "successRate": 1 - (self.stats["errors"] / max(1, self.stats["messagesSent"])),
@@ -544,7 +580,7 @@ class WebSocketManager(SignalControlInterface):
                 "availableSignals": self.getAvailableSignals(),
                 "activeSignals": self.getActiveSignals(),
                 "componentState": self.getComponentState().value,
-                "bySignalType": self.stats["bySignalType"]
+                "bySignalType": bySignalType
             },
             "connections": {
                 "current": len(self.activeConnections),
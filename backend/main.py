@@ -9,7 +9,10 @@ Remove dependência do DataStreamer, usando diretamente o sistema apropriado.
 """
 
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 from contextlib import asynccontextmanager
 from datetime import datetime
 
@@ -30,6 +33,30 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+def _installQueueLogging() -> None:
+    """
+    Move a escrita dos logs para uma thread dedicada.
+    
+    Os handlers do root logger passam a ser servidos por um QueueListener; no event loop
+    fica apenas um QueueHandler que coloca o record numa fila, sem I/O para stderr/ficheiro.
+    """
+    rootLogger = logging.getLogger()
+    handlers = [h for h in rootLogger.handlers if not isinstance(h, logging.handlers.QueueHandler)]
+    if not handlers:
+        return
+    
+    logQueue = queue.SimpleQueue()
+    for handler in handlers:
+        rootLogger.removeHandler(handler)
+    rootLogger.addHandler(logging.handlers.QueueHandler(logQueue))
+    
+    queueListener = logging.handlers.QueueListener(logQueue, *handlers, respect_handler_level=True)
+    queueListener.start()
+    # Garantir que os records pendentes são escritos ao terminar o processo
+    atexit.register(queueListener.stop)
+
+_installQueueLogging()
+
 logger = logging.getLogger(__name__)
 
 @asynccontextmanager
@@ -65,11 +92,13 @@ async def lifespan(app: FastAPI):
                 await zeroMQListener.stop()
                 logger.info("[MAIN] ZeroMQ listener stopped")
             else:
+                # Parar o listener antes do publisher mock: com o publisher ainda ativo o socket SUB
+                # fecha de imediato, caso contrário o term do contexto espera o LINGER completo
                 from tests.mockZeroMQ import mockZeroMQController
-                await mockZeroMQController.stop()
-                logger.info("[MAIN] MockZeroMQ system stopped")
                 await zeroMQListener.stop()
                 logger.info("[MAIN] ZeroMQ listener stopped")
+                await mockZeroMQController.stop()
+                logger.info("[MAIN] MockZeroMQ system stopped")
             
             # Limpar WebSocket connections
             await websocketManager.cleanup()
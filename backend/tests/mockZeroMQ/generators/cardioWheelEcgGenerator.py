@@ -88,29 +88,14 @@ class CardioWheelEcgGenerator:
             # Verificar se deve injetar anomalia
             self._updateAnomalyState()
             
-            # Gerar samples ECG para o chunk
-            ecgSamples = []
-            lodSamples = []
+            # Gerar samples ECG para o chunk (vetorizado)
+            sampleCounters = self.sampleCounter + np.arange(self.chunkSize)
+            phases = self._advancePhases(self.chunkSize)
+            self.sampleCounter += self.chunkSize
+            
+            ecgSamples = self._generateEcgSamples(phases, sampleCounters).astype(np.int64)  # ADC values são inteiros
+            lodSamples = self._generateLodSamples(self.chunkSize)
             
-            for i in range(self.chunkSize):
-                # Gerar sample ECG baseado no tipo atual
-                ecgValue = self._generateEcgSample()
-                lodValue = self._generateLodSample()
-                
-                ecgSamples.append(int(ecgValue))  # ADC values são inteiros
-                lodSamples.append(lodValue)
-                
-                # Avançar contadores
-                self.sampleCounter += 1
-                self.ecgPhase += (2 * np.pi * self.currentHr / 60) / self.samplingRate
-                
-                # Manter fase no range [0, 2π]
-                if self.ecgPhase >= 2 * np.pi:
-                    self.ecgPhase -= 2 * np.pi
-                    # Variar HR ligeiramente a cada batimento
-                    self._updateHeartRate()
-
-
             # Avançar timestamp para próximo chunk
             self.currentTimestamp += self.chunkDuration
             
@@ -131,57 +116,104 @@ class CardioWheelEcgGenerator:
             self.logger.error(f"Error generating ECG chunk: {e}")
             raise
     
-    def _generateEcgSample(self) -> float:
+    def _advancePhases(self, count: int) -> np.ndarray:
         """
-        Gera um sample ECG individual baseado no estado atual.
+        Calcula a fase de cada sample do chunk e avança o estado.
+        
+        A fase avança a taxa constante até completar um batimento; nessa
+        altura volta ao range [0, 2π] e o HR é atualizado, mudando o passo
+        para os samples seguintes.
         
+        Args:
+            count: Número de samples
+            
         Returns:
-            Valor ECG em ADC units
+            Array com a fase usada em cada sample
         """
         
+        twoPi = 2 * np.pi
+        phases = np.empty(count)
+        start = 0
+        
+        while start < count:
+            increment = (twoPi * self.currentHr / 60) / self.samplingRate
+            segment = self.ecgPhase + increment * np.arange(count - start)
+            wrapped = np.flatnonzero(segment + increment >= twoPi)
+            
+            if wrapped.size == 0:
+                phases[start:] = segment
+                self.ecgPhase = segment[-1] + increment
+                break
+            
+            # Batimento completo: manter fase no range [0, 2π] e variar HR
+            end = wrapped[0] + 1
+            phases[start:start + end] = segment[:end]
+            self.ecgPhase = segment[end - 1] + increment - twoPi
+            self._updateHeartRate()
+            start += end
+        
+        return phases
+    
+    def _generateEcgSamples(self, phases: np.ndarray, sampleCounters: np.ndarray) -> np.ndarray:
+        """
+        Gera samples ECG baseados no estado atual.
+        
+        Args:
+            phases: Fase de cada sample na forma de onda
+            sampleCounters: Índice global de cada sample
+            
+        Returns:
+            Valores ECG em ADC units
+        """
+        
+        count = len(phases)
+        
         # Forma de onda ECG básica (simplificada)
         if self.currentAnomalyType == EcgAnomalyType.NORMAL:
             # ECG normal com QRS, P, T waves simuladas
-            ecgWave = self._generateNormalEcgWave()
+            ecgWave = self._generateNormalEcgWave(phases)
             
         elif self.currentAnomalyType == EcgAnomalyType.LOW_AMPLITUDE:
             # Amplitude muito baixa (eletrodo solto)
-            ecgWave = self._generateNormalEcgWave() * 0.05  # 5% da amplitude normal
+            ecgWave = self._generateNormalEcgWave(phases) * 0.05  # 5% da amplitude normal
             
         elif self.currentAnomalyType == EcgAnomalyType.HIGH_AMPLITUDE:
             # Saturação ou interferência
-            ecgWave = self._generateNormalEcgWave() * 5.0   # 5x amplitude normal
+            ecgWave = self._generateNormalEcgWave(phases) * 5.0   # 5x amplitude normal
             # Clipar no máximo ADC
             ecgWave = np.clip(ecgWave, -500, 500)
             
         elif self.currentAnomalyType == EcgAnomalyType.FLAT_SIGNAL:
             # Sinal completamente plano
-            ecgWave = 0.0
+            ecgWave = np.zeros(count)
             
         elif self.currentAnomalyType == EcgAnomalyType.BASELINE_DRIFT:
             # Deriva da linha de base
-            driftAmount = 100 * np.sin(self.sampleCounter * 0.001)  # Deriva lenta
-            ecgWave = self._generateNormalEcgWave() + driftAmount
+            driftAmount = 100 * np.sin(sampleCounters * 0.001)  # Deriva lenta
+            ecgWave = self._generateNormalEcgWave(phases) + driftAmount
             
         elif self.currentAnomalyType == EcgAnomalyType.NOISE_BURST:
             # Rajada de ruído
-            ecgWave = self._generateNormalEcgWave() + np.random.normal(0, self.noiseStd * 3)
+            ecgWave = self._generateNormalEcgWave(phases) + np.random.normal(0, self.noiseStd * 3, count)
             
         else:
-            ecgWave = self._generateNormalEcgWave()
+            ecgWave = self._generateNormalEcgWave(phases)
         
         # Adicionar ruído gaussiano base
-        noise = np.random.normal(0, self.noiseStd)
+        noise = np.random.normal(0, self.noiseStd, count)
         
         # Valor final ADC
-        adcValue = self.baselineValue + ecgWave + noise
+        adcValues = self.baselineValue + ecgWave + noise
         # Clipar para range ADC 16-bit 
-        return np.clip(adcValue, -32768, 32767)
+        return np.clip(adcValues, -32768, 32767)
     
-    def _generateNormalEcgWave(self) -> float:
+    def _generateNormalEcgWave(self, phases: np.ndarray) -> np.ndarray:
         """
         Gera forma de onda ECG normal simplificada.
         
+        Args:
+            phases: Fase de cada sample na forma de onda
+            
         Returns:
             Amplitude ECG relativa ao baseline
         """
@@ -189,38 +221,39 @@ class CardioWheelEcgGenerator:
         P_SCALE = 6400    # 0.2 mV * 6400 = 1280 ADC
         QRS_SCALE = 6400  # 1.5 mV * 6400 = 9600 ADC
         T_SCALE = 6400    # 0.3 mV * 6400 = 1920 ADC
-
         
         # ECG simplificado com 3 componentes principais
         # P wave (pequena, antes do QRS)
-        pWave = 0.2 * P_SCALE * np.exp(-((self.ecgPhase - 0.2) / 0.1)**2) if 0.1 < self.ecgPhase < 0.3 else 0
+        pWave = np.where((phases > 0.1) & (phases < 0.3),
+                         0.2 * P_SCALE * np.exp(-((phases - 0.2) / 0.1)**2), 0.0)
         
         # QRS complex (grande, sharp)
-        if 0.8 < self.ecgPhase < 1.2:
-            qrsPhase = (self.ecgPhase - 1.0) / 0.2
-            qrsWave = 1.5 * QRS_SCALE * np.exp(-(qrsPhase**2) * 10)
-        else:
-            qrsWave = 0
-            
+        qrsPhase = (phases - 1.0) / 0.2
+        qrsWave = np.where((phases > 0.8) & (phases < 1.2),
+                           1.5 * QRS_SCALE * np.exp(-(qrsPhase**2) * 10), 0.0)
         
         # T wave (média, depois do QRS)
-        tWave = 0.3 * T_SCALE * np.exp(-((self.ecgPhase - 1.8) / 0.3)**2) if 1.4 < self.ecgPhase < 2.2 else 0
+        tWave = np.where((phases > 1.4) & (phases < 2.2),
+                         0.3 * T_SCALE * np.exp(-((phases - 1.8) / 0.3)**2), 0.0)
         
         return pWave + qrsWave + tWave
     
-    def _generateLodSample(self) -> int:
+    def _generateLodSamples(self, count: int) -> np.ndarray:
         """
-        Gera sample LOD (Lead-Off Detection).
+        Gera samples LOD (Lead-Off Detection).
         
+        Args:
+            count: Número de samples
+            
         Returns:
-            0 para eletrodo conectado, 1 para solto
+            Array com 0 para eletrodo conectado, 1 para solto
         """
         
         # LOD ativo se anomalia de baixa amplitude (eletrodo solto)
         if self.currentAnomalyType == EcgAnomalyType.LOW_AMPLITUDE:
-            return 1
+            return np.ones(count, dtype=np.int64)
         else:
-            return 0
+            return np.zeros(count, dtype=np.int64)
     
     def _updateAnomalyState(self):
         """
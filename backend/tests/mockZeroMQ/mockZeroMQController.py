@@ -9,11 +9,14 @@ fossem sensores reais. Coordena frequências, timing, anomalias e
 permite controlo granular de cada tópico através do sistema Signal Control.
 """
 
+import array
 import asyncio
 import logging
+import types
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Set
-from enum import Enum
+from typing import Callable, Dict, List, Any, Optional, Tuple, FrozenSet, Mapping
+from enum import Enum, IntEnum
 
 from app.core import settings, eventManager
 from app.core.signalControl import SignalControlInterface, SignalState, ComponentState, signalControlManager
@@ -39,6 +42,21 @@ class ControllerState(Enum):
     STOPPING = "stopping"
     ERROR = "error"
 
+class StatCounter(IntEnum):
+    """Índices dos contadores de estatísticas (globais e por tópico)"""
+    GENERATED = 0
+    SENT = 1
+    REJECTED = 2
+    ANOMALIES = 3
+    ERRORS = 4      # Apenas global
+
+# Número de contadores mantidos por tópico (GENERATED..ANOMALIES)
+TOPIC_COUNTER_COUNT = 4
+
+# Limite de eventos de erro emitidos por janela (evita tempestade de eventos)
+ERROR_EMIT_MAX_PER_WINDOW = 10
+ERROR_EMIT_WINDOW_SECONDS = 1.0
+
 class MockZeroMQController(SignalControlInterface):
     """Controller principal do sistema mock ZeroMQ com controlo de sinais"""
     
@@ -75,29 +93,13 @@ class MockZeroMQController(SignalControlInterface):
         self.topicTasks: Dict[str, asyncio.Task] = {}
         
         # Signal Control properties
-        self.availableSignals = list(self.topicGenerators.keys())
+        self.availableSignals: Tuple[str, ...] = tuple(self.topicGenerators.keys())
         defaultActiveStates = settings.signalControl.defaultActiveStates["publisher"]
-        self.activeSignals: Set[str] = {signal for signal, active in defaultActiveStates.items() if active}
+        # Snapshot imutável, substituído em cada escrita
+        self.activeSignals: FrozenSet[str] = frozenset(signal for signal, active in defaultActiveStates.items() if active)
         
         # Estatísticas globais
-        self.stats = {
-            "startTime": None,
-            "totalRuntime": 0.0,
-            "totalPaused": 0.0,
-            "messagesGenerated": 0,
-            "messagesSent": 0,
-            "messagesRejected": 0,
-            "anomaliesInjected": 0,
-            "byTopic": {topic: {
-                "generated": 0,
-                "sent": 0,
-                "rejected": 0,
-                "anomalies": 0,
-                "lastGenerated": None,
-                "currentFrequency": freq
-            } for topic, freq in self.topicFrequencies.items()},
-            "errors": 0
-        }
+        self._resetStats()
         
         # Configurações de anomalias globais
         self.anomalyInjection = self.mockConfig.anomalyInjection
@@ -108,16 +110,75 @@ class MockZeroMQController(SignalControlInterface):
         self.globalMessageCounter = 0
         self.lastRateResetTime = 0.0
         
+        # Rate limiting de eventos de erro
+        self._errorEmitWindow: deque = deque(maxlen=ERROR_EMIT_MAX_PER_WINDOW)
+        self._suppressedErrors = 0
+        
         # Registar no manager central de Signal Control
         signalControlManager.registerComponent("publisher", self)
         
         self.logger.info(f"MockZeroMQController initialized for {len(self.topicGenerators)} topics with Signal Control")
     
+    def _resetStats(self):
+        """
+        Inicializa estatísticas do controller.
+        
+        Os contadores ficam em arrays de inteiros indexados por StatCounter
+        (incremento barato no caminho quente); os campos restantes ficam em
+        self.stats. O formato dict completo é materializado em _buildStats().
+        """
+        
+        self._counters = array.array('q', [0] * len(StatCounter))
+        self._topicCounters = {
+            topic: array.array('q', [0] * TOPIC_COUNTER_COUNT) for topic in self.topicFrequencies
+        }
+        self.stats = {
+            "startTime": None,
+            "totalRuntime": 0.0,
+            "totalPaused": 0.0,
+            "byTopic": {topic: {
+                "lastGenerated": None,
+                "currentFrequency": freq
+            } for topic, freq in self.topicFrequencies.items()}
+        }
+    
+    def _buildStats(self) -> Dict[str, Any]:
+        """
+        Constrói estatísticas no formato dict (compatível com consumidores REST).
+        
+        Returns:
+            Dict com contadores globais e por tópico
+        """
+        
+        counters = self._counters
+        byTopic = {}
+        for topic, topicStats in self.stats["byTopic"].items():
+            topicCounters = self._topicCounters[topic]
+            byTopic[topic] = {
+                "generated": topicCounters[StatCounter.GENERATED],
+                "sent": topicCounters[StatCounter.SENT],
+                "rejected": topicCounters[StatCounter.REJECTED],
+                "anomalies": topicCounters[StatCounter.ANOMALIES],
+                **topicStats
+            }
+        
+        return {
+            "startTime": self.stats["startTime"],
+            "totalRuntime": self.stats["totalRuntime"],
+            "totalPaused": self.stats["totalPaused"],
+            "messagesGenerated": counters[StatCounter.GENERATED],
+            "messagesSent": counters[StatCounter.SENT],
+            "messagesRejected": counters[StatCounter.REJECTED],
+            "anomaliesInjected": counters[StatCounter.ANOMALIES],
+            "byTopic": byTopic,
+            "errors": counters[StatCounter.ERRORS]
+        }
+    
     # Signal Control Interface Implementation
     
-    def getAvailableSignals(self) -> List[str]:
-        """Retorna lista de tópicos disponíveis para geração"""
-        return self.availableSignals.copy()
+    def getAvailableSignals(self) -> Tuple[str, ...]:
+        """Retorna tuplo imutável de tópicos disponíveis para geração"""
+        return self.availableSignals
     
     def getActiveSignals(self) -> List[str]:
         """Retorna lista de tópicos atualmente ativos"""
@@ -132,7 +193,7 @@ class MockZeroMQController(SignalControlInterface):
         if signal in self.activeSignals:
             return True  # Já ativo
         
-        self.activeSignals.add(signal)
+        self.activeSignals = self.activeSignals | {signal}
         
         # Se sistema estiver a rodar, iniciar task do tópico
         if self.state == ControllerState.RUNNING:
@@ -148,7 +209,7 @@ class MockZeroMQController(SignalControlInterface):
         if signal not in self.activeSignals:
             return True  # Já inativo
         
-        self.activeSignals.remove(signal)
+        self.activeSignals = self.activeSignals - {signal}
         
         # Parar task se existir
         if signal in self.topicTasks:
@@ -213,15 +274,14 @@ class MockZeroMQController(SignalControlInterface):
                     raise ValueError(f"No valid topics in {topics}. Available: {list(self.topicGenerators.keys())}")
             
             # Sincronizar com Signal Control (só ativar os que estão disponíveis)
-            self.activeSignals = requestedTopics.copy()
+            self.activeSignals = frozenset(requestedTopics)
             
             # Iniciar publisher ZeroMQ
             await self.publisher.start()
             
             # Reset geradores
             for topic in self.activeSignals:
-                generator = self.topicGenerators[topic]
-                generator.reset()
+                self.topicGenerators[topic].reset()
             
             # Iniciar tasks de geração por tópico
             await self._startTopicTasks()
@@ -241,7 +301,7 @@ class MockZeroMQController(SignalControlInterface):
             
         except Exception as e:
             self.state = ControllerState.ERROR
-            self.stats["errors"] += 1
+            self._counters[StatCounter.ERRORS] += 1
             await self._emitError("startup_failed", str(e))
             raise
     
@@ -270,7 +330,7 @@ class MockZeroMQController(SignalControlInterface):
             await eventManager.emit("mock.controller_stopped", {
                 "timestamp": datetime.now().isoformat(),
                 "uptime": self.stats["totalRuntime"],
-                "finalStats": self.stats.copy()
+                "finalStats": self._buildStats()
             })
             
             self.state = ControllerState.STOPPED
@@ -278,7 +338,7 @@ class MockZeroMQController(SignalControlInterface):
             
         except Exception as e:
             self.logger.error(f"Error stopping MockZeroMQ system: {e}")
-            self.stats["errors"] += 1
+            self._counters[StatCounter.ERRORS] += 1
             self.state = ControllerState.ERROR
     
     async def pause(self):
@@ -338,16 +398,22 @@ class MockZeroMQController(SignalControlInterface):
                 self.logger.debug(f"Started generation task for topic: {topic}")
     
     async def _stopTopicTasks(self):
-        """Para todas as tasks de geração de tópicos."""
+        """Para todas as tasks de geração de tópicos (canceladas e aguardadas em paralelo)."""
         
-        for topic, task in self.topicTasks.items():
-            if not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
-                self.logger.debug(f"Stopped generation task for topic: {topic}")
+        pendingTopics = [topic for topic, task in self.topicTasks.items() if not task.done()]
+        pendingTasks = [self.topicTasks[topic] for topic in pendingTopics]
+        for task in pendingTasks:
+            task.cancel()
+        
+        # Tasks independentes: aguardar em conjunto em vez de uma a uma
+        results = await asyncio.gather(*pendingTasks, return_exceptions=True)
+        
+        # Registar erros reais (o cancelamento é o resultado esperado)
+        for topic, result in zip(pendingTopics, results):
+            if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError):
+                self.logger.error(f"Generation task for {topic} failed: {result}")
+        
+        self.logger.debug(f"Stopped {len(pendingTasks)} generation tasks")
         
         self.topicTasks.clear()
     
@@ -363,8 +429,15 @@ class MockZeroMQController(SignalControlInterface):
         frequency = self.topicFrequencies[topic]
         interval = 1.0 / frequency
         
+        # Método de geração resolvido uma vez, fora do loop temporizado
+        generate = self._resolveGenerateMethod(topic, generator)
+        
         self.logger.debug(f"Starting generation loop for {topic} at {frequency}Hz ({interval:.3f}s interval)")
         
+        # Agendamento por deadline absoluto: atrasos do sleep não se acumulam
+        loop = asyncio.get_running_loop()
+        nextTick = loop.time()
+        
         try:
             while self.state == ControllerState.RUNNING:
                 # Verificar se tópico ainda está ativo via Signal Control
@@ -372,59 +445,71 @@ class MockZeroMQController(SignalControlInterface):
                     self.logger.debug(f"Topic {topic} disabled via Signal Control, stopping generation")
                     break
                 
-                loopStartTime = asyncio.get_event_loop().time()
-                
                 # Verificar rate limiting global
                 if not await self._checkGlobalRateLimit():
-                    await asyncio.sleep(0.01)
+                    # Aguardar pelo reset da janela de rate limit em vez de tentar a cada 10ms
+                    await asyncio.sleep(max(0.001, self.lastRateResetTime + 1.0 - loop.time()))
                     continue
                 
                 # Gerar dados do tópico
-                success = await self._generateAndSendTopicData(topic, generator)
+                success = await self._generateAndSendTopicData(topic, generate)
                 
                 if success:
-                    self.stats["byTopic"][topic]["generated"] += 1
-                    self.stats["messagesGenerated"] += 1
+                    self._topicCounters[topic][StatCounter.GENERATED] += 1
+                    self._counters[StatCounter.GENERATED] += 1
                 
-                # Aguardar próximo ciclo
-                elapsed = asyncio.get_event_loop().time() - loopStartTime
-                sleepTime = max(0, interval - elapsed)
+                # Aguardar próximo ciclo (ciclos em atraso são gerados de seguida, sem sleep)
+                nextTick += interval
+                sleepTime = nextTick - loop.time()
                 
                 if sleepTime > 0:
                     await asyncio.sleep(sleepTime)
-                else:
-                    # Log warning se não conseguir manter frequência
-                    self.logger.warning(f"Cannot maintain {frequency}Hz for {topic} (took {elapsed:.3f}s)")
+                elif sleepTime < -interval:
+                    # Log warning se não conseguir manter frequência e ressincronizar
+                    self.logger.warning(f"Cannot maintain {frequency}Hz for {topic} ({-sleepTime:.3f}s behind)")
+                    nextTick = loop.time()
                     
         except asyncio.CancelledError:
             self.logger.debug(f"Generation loop cancelled for topic: {topic}")
             
         except Exception as e:
             self.logger.error(f"Error in generation loop for {topic}: {e}")
-            self.stats["errors"] += 1
+            self._counters[StatCounter.ERRORS] += 1
             await self._emitError("generation_loop_failed", f"{topic}: {e}")
     
-    async def _generateAndSendTopicData(self, topic: str, generator) -> bool:
+    def _resolveGenerateMethod(self, topic: str, generator) -> Callable[[], Dict[str, Any]]:
         """
-        Gera dados de um tópico e envia via publisher.
+        Obtém o método de geração adequado ao tipo de gerador do tópico.
         
         Args:
             topic: Nome do tópico
             generator: Gerador específico do tópico
             
         Returns:
-            True se enviado com sucesso
+            Método ligado que produz os dados brutos de um ciclo
+        """
+        
+        if topic in ("Polar_PPI", "Unity_Alcohol", "Unity_CarInfo"):
+            return generator.generateEvent
+        if topic == "Camera_FaceLandmarks":
+            return generator.generateFrame
+        # ECG, ACC, GYR, EEG usam chunks
+        return generator.generateChunk
+    
+    async def _generateAndSendTopicData(self, topic: str, generate: Callable[[], Dict[str, Any]]) -> bool:
+        """
+        Gera dados de um tópico e envia via publisher.
+        
+        Args:
+            topic: Nome do tópico
+            generate: Método de geração do tópico (ver _resolveGenerateMethod)
+            
+        Returns:
+            True se aceite pelo publisher (em modo lote: enfileirado para envio)
         """
         
         try:
-            # Gerar dados baseado no tipo de gerador
-            if topic in ["Polar_PPI", "Unity_Alcohol", "Unity_CarInfo"]:
-                rawData = generator.generateEvent()
-            elif topic == "Camera_FaceLandmarks": 
-                rawData = generator.generateFrame()
-            else:
-                # ECG, ACC, GYR, EEG usam chunks
-                rawData = generator.generateChunk()
+            rawData = generate()
             
             # Formatar dados para ZeroMQ
             formattedData = self.formatter.formatTopicData(topic, rawData)
@@ -432,27 +517,32 @@ class MockZeroMQController(SignalControlInterface):
             # Enviar via publisher
             success = await self.publisher.publishMessage(topic, formattedData)
             
+            counters = self._counters
+            topicCounters = self._topicCounters[topic]
+            
+            # Em modo lote do publisher, SENT significa "aceite para envio": descartes (zmq.Again)
+            # e erros de envio posteriores só são contabilizados nas estatísticas do publisher
             if success:
-                self.stats["byTopic"][topic]["sent"] += 1
-                self.stats["messagesSent"] += 1
+                topicCounters[StatCounter.SENT] += 1
+                counters[StatCounter.SENT] += 1
                 self.stats["byTopic"][topic]["lastGenerated"] = datetime.now().isoformat()
                 
                 # Verificar se foi injetada anomalia
                 if rawData.get("anomalyType", "normal") != "normal":
-                    self.stats["byTopic"][topic]["anomalies"] += 1
-                    self.stats["anomaliesInjected"] += 1
+                    topicCounters[StatCounter.ANOMALIES] += 1
+                    counters[StatCounter.ANOMALIES] += 1
                 
             else:
-                self.stats["byTopic"][topic]["rejected"] += 1
-                self.stats["messagesRejected"] += 1
+                topicCounters[StatCounter.REJECTED] += 1
+                counters[StatCounter.REJECTED] += 1
             
             return success
             
         except Exception as e:
             self.logger.error(f"Error generating/sending data for {topic}: {e}")
-            self.stats["byTopic"][topic]["rejected"] += 1
-            self.stats["messagesRejected"] += 1
-            self.stats["errors"] += 1
+            self._topicCounters[topic][StatCounter.REJECTED] += 1
+            self._counters[StatCounter.REJECTED] += 1
+            self._counters[StatCounter.ERRORS] += 1
             return False
     
     async def _checkGlobalRateLimit(self) -> bool:
@@ -479,19 +569,37 @@ class MockZeroMQController(SignalControlInterface):
     
     async def _emitError(self, errorType: str, message: str):
         """
-        Emite evento de erro.
+        Emite evento de erro, limitado a ERROR_EMIT_MAX_PER_WINDOW por janela.
+        
+        Erros acima do limite são apenas contados; o total suprimido segue
+        no próximo evento emitido.
         
         Args:
             errorType: Tipo do erro
             message: Mensagem de erro
         """
         
+        currentTime = asyncio.get_event_loop().time()
+        window = self._errorEmitWindow
+        
+        if len(window) == window.maxlen and currentTime - window[0] < ERROR_EMIT_WINDOW_SECONDS:
+            self._suppressedErrors += 1
+            return
+        
+        window.append(currentTime)
+        suppressed = self._suppressedErrors
+        self._suppressedErrors = 0
+        
+        if suppressed:
+            self.logger.warning(f"Suppressed {suppressed} controller error events")
+        
         await eventManager.emit("mock.controller_error", {
             "timestamp": datetime.now().isoformat(),
             "errorType": errorType,
             "message": message,
             "state": self.state.value,
-            "stats": self.stats.copy()
+            "suppressedErrors": suppressed,
+            "stats": self._buildStats()
         })
     
     # Configuration and Control Methods
@@ -578,7 +686,7 @@ class MockZeroMQController(SignalControlInterface):
             "totalPausedTime": self.totalPausedDuration,
             "activeTopics": list(self.activeSignals),
             "availableTopics": list(self.topicGenerators.keys()),
-            "stats": self.stats.copy(),
+            "stats": self._buildStats(),
             "frequencies": self.topicFrequencies.copy(),
             "publisher": self.publisher.getStatus(),
             "formatter": self.formatter.getStats(),
@@ -630,17 +738,23 @@ class MockZeroMQController(SignalControlInterface):
             health = "warning" if health == "healthy" else health
             warnings.append("No active topics")
         
+        messagesGenerated = self._counters[StatCounter.GENERATED]
+        messagesSent = self._counters[StatCounter.SENT]
+        messagesRejected = self._counters[StatCounter.REJECTED]
+        anomaliesInjected = self._counters[StatCounter.ANOMALIES]
+        errors = self._counters[StatCounter.ERRORS]
+        
         # Verificar taxa de rejeição
-        if self.stats["messagesGenerated"] > 0:
-            rejectionRate = self.stats["messagesRejected"] / self.stats["messagesGenerated"]
+        if messagesGenerated > 0:
+            rejectionRate = messagesRejected / messagesGenerated
             if rejectionRate > 0.1:  # >10% rejeição
                 health = "warning" if health == "healthy" else health
                 warnings.append(f"High rejection rate: {rejectionRate:.1%}")
         
         # Verificar erros
-        if self.stats["errors"] > 5:
+        if errors > 5:
             health = "warning" if health == "healthy" else health
-            warnings.append(f"Multiple errors detected: {self.stats['errors']}")
+            warnings.append(f"Multiple errors detected: {errors}")
         
         uptime = self.getUptime()
         
@@ -650,11 +764,11 @@ class MockZeroMQController(SignalControlInterface):
             "warnings": warnings,
             "lastCheck": datetime.now().isoformat(),
             "metrics": {
-                "rejectionRate": self.stats["messagesRejected"] / max(1, self.stats["messagesGenerated"]),
-                "successRate": self.stats["messagesSent"] / max(1, self.stats["messagesGenerated"]),
+                "rejectionRate": messagesRejected / max(1, messagesGenerated),
+                "successRate": messagesSent / max(1, messagesGenerated),
                 "activeTopicsCount": len(self.activeSignals),
                 "totalTopicsCount": len(self.topicGenerators),
-                "anomaliesPerMinute": self.stats["anomaliesInjected"] / max(1, uptime / 60) if uptime > 0 else 0
+                "anomaliesPerMinute": anomaliesInjected / max(1, uptime / 60) if uptime > 0 else 0
             },
             "components": {
                 "controller": self.state.value,
@@ -667,24 +781,7 @@ class MockZeroMQController(SignalControlInterface):
         """Reset completo do sistema."""
         
         # Reset estatísticas
-        self.stats = {
-            "startTime": None,
-            "totalRuntime": 0.0,
-            "totalPaused": 0.0,
-            "messagesGenerated": 0,
-            "messagesSent": 0,
-            "messagesRejected": 0,
-            "anomaliesInjected": 0,
-            "byTopic": {topic: {
-                "generated": 0,
-                "sent": 0,
-                "rejected": 0,
-                "anomalies": 0,
-                "lastGenerated": None,
-                "currentFrequency": freq
-            } for topic, freq in self.topicFrequencies.items()},
-            "errors": 0
-        }
+        self._resetStats()
         
         # Reset componentes
         self.publisher.reset()
@@ -700,6 +797,8 @@ class MockZeroMQController(SignalControlInterface):
         self.lastGlobalAnomalyTime = 0.0
         self.globalMessageCounter = 0
         self.lastRateResetTime = 0.0
+        self._errorEmitWindow.clear()
+        self._suppressedErrors = 0
         
         self.logger.info("MockZeroMQController reset completed")
     
@@ -719,17 +818,17 @@ class MockZeroMQController(SignalControlInterface):
             return 0.0
         return (datetime.now() - self.startTime).total_seconds()
     
-    def getAvailableTopics(self) -> List[str]:
-        """Lista de todos os tópicos disponíveis."""
-        return list(self.topicGenerators.keys())
+    def getAvailableTopics(self) -> Tuple[str, ...]:
+        """Tuplo de todos os tópicos disponíveis."""
+        return self.availableSignals
     
     def getActiveTopics(self) -> List[str]:
         """Lista de tópicos atualmente ativos."""
         return list(self.activeSignals)
     
-    def getTopicFrequencies(self) -> Dict[str, float]:
-        """Frequências atuais de todos os tópicos."""
-        return self.topicFrequencies.copy()
+    def getTopicFrequencies(self) -> Mapping[str, float]:
+        """Vista só de leitura das frequências atuais de todos os tópicos."""
+        return types.MappingProxyType(self.topicFrequencies)
     
     def setTopicFrequencies(self, frequencies: Dict[str, float]):
         """
@@ -755,9 +854,9 @@ class MockZeroMQController(SignalControlInterface):
             "summary": {
                 "activeTopics": len(self.activeSignals),
                 "totalTopics": len(self.topicGenerators),
-                "messagesPerSecond": self.stats["messagesSent"] / max(1, self.getUptime()),
-                "anomaliesPerMinute": self.stats["anomaliesInjected"] / max(1, self.getUptime() / 60),
-                "successRate": self.stats["messagesSent"] / max(1, self.stats["messagesGenerated"])
+                "messagesPerSecond": self._counters[StatCounter.SENT] / max(1, self.getUptime()),
+                "anomaliesPerMinute": self._counters[StatCounter.ANOMALIES] / max(1, self.getUptime() / 60),
+                "successRate": self._counters[StatCounter.SENT] / max(1, self._counters[StatCounter.GENERATED])
             }
         }
 
@@ -8,19 +8,76 @@ Cada tópico tem o seu método específico de formatação que cria a estrutura:
 Aplica timestamps corretos, serializa com msgpack, e valida estrutura antes de enviar.
 """
 
+import array
+import functools
 import logging
+import time
 import msgpack
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Set, Callable
 import numpy as np
 
 from app.core import settings
 from app.core.exceptions import ZeroMQProcessingError
 
+def _validateAndFlattenLandmarks(landmarksArray: np.ndarray) -> Tuple[bool, np.ndarray]:
+    """
+    Verifica range normalizado [0, 1] e faz flatten dos landmarks.
+    
+    Args:
+        landmarksArray: Array (N, 3) de landmarks
+        
+    Returns:
+        Tuplo (coordenadas todas válidas, array flat de N*3 valores)
+    """
+    
+    flat = landmarksArray.ravel()
+    ok = bool(flat.min() >= 0.0) and bool(flat.max() <= 1.0)
+    return ok, flat
+
+def _interleaveColumns(columns: Tuple[np.ndarray, ...]) -> np.ndarray:
+    """
+    Intercala colunas (SoA) num único array (N, C) linha a linha (AoS).
+    
+    O buffer de saída é alocado uma vez e cada coluna é copiada com um
+    slice strided em C, sem arrays intermédios.
+    
+    Args:
+        columns: Arrays 1D com o mesmo comprimento
+        
+    Returns:
+        Array contíguo (N, C) com uma amostra por linha
+    """
+    
+    out = np.empty((len(columns[0]), len(columns)), dtype=np.result_type(*columns))
+    for j, column in enumerate(columns):
+        out[:, j] = column
+    return out
+
 class ZeroMQFormatter:
     """Formatador de dados mock para protocolo ZeroMQ"""
     
-    def __init__(self):
+    # Labels estáticos partilhados entre mensagens (evita alocar uma lista por mensagem)
+    _LABELS_ECG = ["ECG", "LOD"]
+    _LABELS_XYZ = ["X", "Y", "Z"]
+    _LABELS_PPI = ["error_ms", "flags", "value"]
+    _LABELS_CAMERA = ["landmarks", "gaze_dx", "gaze_dy", "ear", "blink_rate", "blink_counter", "frame_b64"]
+    _LABELS_ALCOHOL = ["alcohol_level"]
+    _LABELS_CAR = ["speed", "lane_centrality"]
+    
+    # Tópicos de sistema: payload opaco sob chave fixa -> (chave, inclui "ts")
+    _PASSTHROUGH_TOPICS = {
+        "Control": ("control", True),
+        "Timestamp": ("system_timestamp", True),
+        "Cfg": ("config", False)
+    }
+    
+    def __init__(self, strictValidation: bool = False):
+        """
+        Args:
+            strictValidation: Validar estrutura de todas as mensagens (senão só a
+                primeira por tópico e depois uma em cada validateEveryN)
+        """
         self.logger = logging.getLogger(__name__)
         
         # Carregar configurações centralizadas
@@ -31,37 +88,78 @@ class ZeroMQFormatter:
         self.timingConfig = self.mockConfig.timingConfig
         self.useRealtimeTimestamps = self.timingConfig["useRealtimeTimestamps"]
         self.timestampPrecision = self.timingConfig["timestampPrecision"]
+        self._timestampFormatSpec = f".{self.timestampPrecision}f"
+        
+        # Arrays NumPy enviados como ExtType msgpack (sem conversão para listas Python)
+        self.numpyExtEnabled = self.mockConfig.performanceConfig["numpyExtEnabled"]
+        self.numpyExtType = self.zmqConfig.numpyExtType
+        
+        # Floats serializados em 32 bits (metade dos bytes, precisão reduzida)
+        self.singleFloatEnabled = self.mockConfig.performanceConfig["singleFloatEnabled"]
+        self._eegDtype = np.float32 if self.singleFloatEnabled else None
+        
+        # Packer msgpack persistente (reutiliza buffer interno entre mensagens)
+        self._packer = msgpack.Packer(
+            use_bin_type=True,
+            use_single_float=self.singleFloatEnabled,
+            default=self._encodeNumpyExt
+        )
         
         # Mapeamento de tópicos para métodos de formatação
         self.topicFormatters = {
             "Polar_PPI": self._formatPolarPPI,
             "CardioWheel_ECG": self._formatCardioWheelECG,
             "CardioWheel_ACC": self._formatCardioWheelACC,
-            "CardioWheel_GYR": self._formatCardioWheelGYR,
+            "CardioWheel_GYR": self._formatCardioWheelACC,  # Formato idêntico ao ACC
             "BrainAcess_EEG": self._formatBrainAccessEEG,
             "Camera_FaceLandmarks": self._formatCameraFaceLandmarks,
             "Unity_Alcohol": self._formatUnityAlcohol,
-            "Unity_CarInfo": self._formatUnityCarInfo,
-            "Control": self._formatSystemControl,
-            "Timestamp": self._formatSystemTimestamp,
-            "Cfg": self._formatSystemConfig
+            "Unity_CarInfo": self._formatUnityCarInfo
         }
+        self.topicFormatters.update({
+            topic: functools.partial(self._formatPassthrough, key, includeTimestamp)
+            for topic, (key, includeTimestamp) in self._PASSTHROUGH_TOPICS.items()
+        })
+        self._supportedTopics = frozenset(self.topicFormatters)
         
         # Validação de configurações
         self.validationConfig = self.zmqConfig.topicValidationConfig
+        self.strictValidation = strictValidation
+        self.validateEveryN = 1000
+        self._validatedTopics: Set[str] = set()
+        
+        # Ranges de validação e canais resolvidos uma vez (não mudam em runtime)
+        self._polarPpiRange = tuple(self.zmqConfig.topicProcessingConfig["Polar_PPI"]["validPpiRange"])
+        self._alcoholRange = tuple(self.validationConfig["Unity_Alcohol"]["valueRanges"]["alcohol_level"])
+        carInfoRanges = self.validationConfig["Unity_CarInfo"]["valueRanges"]
+        self._speedRange = tuple(carInfoRanges["speed"])
+        self._centralityRange = tuple(carInfoRanges["lane_centrality"])
+        self._eegChannels = tuple(self.mockConfig.generatorBaseConfig["eeg"]["channelNames"])
+        
+        # Labels estáticos dos tópicos com formato {"ts", "labels", "data"}
+        self.topicLabels = {
+            "Polar_PPI": self._LABELS_PPI,
+            "CardioWheel_ECG": self._LABELS_ECG,
+            "CardioWheel_ACC": self._LABELS_XYZ,
+            "CardioWheel_GYR": self._LABELS_XYZ,
+            "BrainAcess_EEG": list(self._eegChannels),
+            "Camera_FaceLandmarks": self._LABELS_CAMERA,
+            "Unity_Alcohol": self._LABELS_ALCOHOL,
+            "Unity_CarInfo": self._LABELS_CAR
+        }
         
-        # Estatísticas de formatação
-        self.stats = {
-            "totalFormatted": 0,
-            "totalErrors": 0,
-            "byTopic": {topic: {
-                "formatted": 0,
-                "errors": 0,
-                "lastFormatted": None,
-                "lastError": None
-            } for topic in self.topicFormatters.keys()}
+        # Porções estáticas pré-serializadas por tópico (só ts e data variam)
+        self.topicHeaders = {
+            topic: self._buildHeader(labels) for topic, labels in self.topicLabels.items()
         }
         
+        # Packers especializados por tópico (formatar + validar + serializar)
+        self.topicPackers = {topic: self._buildPacker(topic) for topic in self.topicFormatters}
+        
+        # Estatísticas de formatação
+        self._topicIndex = {topic: i for i, topic in enumerate(self.topicFormatters)}
+        self._resetStats()
+        
         self.logger.info(f"ZeroMQFormatter initialized for {len(self.topicFormatters)} topics")
     
     def formatTopicData(self, topic: str, rawData: Dict[str, Any], 
@@ -81,7 +179,8 @@ class ZeroMQFormatter:
             ZeroMQProcessingError: Se formatação falhar
         """
         
-        if topic not in self.topicFormatters:
+        packer = self.topicPackers.get(topic)
+        if packer is None:
             raise ZeroMQProcessingError(
                 topic=topic,
                 operation="format_lookup",
@@ -91,27 +190,20 @@ class ZeroMQFormatter:
         try:
             # Usar timestamp atual se não fornecido
             if timestamp is None:
-                timestamp = datetime.now().timestamp()
+                timestamp = time.time()
             
             # Formatar timestamp com precisão configurada
-            timestampStr = f"{timestamp:.{self.timestampPrecision}f}"
-            
-            self.logger.debug(f"Formatting data for topic '{topic}' at timestamp {timestampStr}")
+            timestampStr = format(timestamp, self._timestampFormatSpec)
             
-            # Chamar formatador específico do tópico
-            formatter = self.topicFormatters[topic]
-            formattedData = formatter(rawData, timestampStr)
+            self.logger.debug("Formatting data for topic '%s' at timestamp %s", topic, timestampStr)
             
-            # Validar estrutura antes de serializar
-            self._validateFormattedData(topic, formattedData)
-            
-            # Serializar com msgpack
-            serializedData = msgpack.packb(formattedData, use_bin_type=True)
+            # Formatar, validar e serializar com o packer do tópico
+            serializedData = packer(rawData, timestampStr)
             
             # Atualizar estatísticas
             self._updateStats(topic, success=True)
             
-            self.logger.debug(f"Successfully formatted {topic}: {len(serializedData)} bytes")
+            self.logger.debug("Successfully formatted %s: %d bytes", topic, len(serializedData))
             
             return serializedData
             
@@ -124,6 +216,145 @@ class ZeroMQFormatter:
                 rawData=rawData
             )
     
+    def _buildHeader(self, labels: List[str]) -> Tuple[bytes, bytes]:
+        """
+        Pré-serializa as porções estáticas de uma mensagem {"ts", "labels", "data"}.
+        
+        Args:
+            labels: Labels fixos do tópico
+            
+        Returns:
+            Tuplo (prefixo até à chave "ts", bloco entre o valor de "ts" e o valor de "data")
+        """
+        
+        prefix = b"\x83" + msgpack.packb("ts", use_bin_type=True)  # fixmap com 3 entradas
+        infix = (
+            msgpack.packb("labels", use_bin_type=True) +
+            msgpack.packb(labels, use_bin_type=True) +
+            msgpack.packb("data", use_bin_type=True)
+        )
+        return prefix, infix
+    
+    def _buildPassthroughPacker(self, key: str, includeTimestamp: bool) -> Callable[[Any, str], bytes]:
+        """
+        Cria função que serializa um tópico de sistema sem construir o dict.
+        
+        O payload é opaco: só "ts" (se existir) e o valor são serializados por
+        mensagem; o resultado é byte-a-byte igual a msgpack.packb de
+        _formatPassthrough.
+        
+        Args:
+            key: Chave fixa do payload
+            includeTimestamp: Se a mensagem inclui "ts"
+            
+        Returns:
+            Função (rawData, timestamp) -> bytes msgpack
+        """
+        
+        pack = self._packer.pack
+        keyBytes = msgpack.packb(key, use_bin_type=True)
+        
+        if not includeTimestamp:
+            prefix = b"\x81" + keyBytes  # fixmap com 1 entrada
+            
+            def packPassthrough(rawData: Any, timestamp: str) -> bytes:
+                return prefix + pack(rawData)
+            
+            return packPassthrough
+        
+        prefix = b"\x82" + msgpack.packb("ts", use_bin_type=True)  # fixmap com 2 entradas
+        
+        def packTimestampedPassthrough(rawData: Any, timestamp: str) -> bytes:
+            return b"".join((prefix, pack(timestamp), keyBytes, pack(rawData)))
+        
+        return packTimestampedPassthrough
+    
+    def getHeader(self, topic: str) -> Optional[Tuple[bytes, bytes]]:
+        """
+        Retorna porções estáticas pré-serializadas de um tópico.
+        
+        Args:
+            topic: Nome do tópico
+            
+        Returns:
+            Tuplo (prefixo, bloco intermédio) ou None se tópico não tem formato fixo
+        """
+        
+        return self.topicHeaders.get(topic)
+    
+    def _encodeNumpyExt(self, obj: Any) -> msgpack.ExtType:
+        """
+        Hook do Packer: serializa arrays NumPy como ExtType com o buffer bruto.
+        
+        Payload do ExtType: msgpack {"dtype": str, "shape": [..], "data": bytes}
+        
+        Args:
+            obj: Objeto que o msgpack não sabe serializar
+            
+        Returns:
+            ExtType com o array serializado
+            
+        Raises:
+            TypeError: Se objeto não for um array NumPy
+        """
+        
+        if not isinstance(obj, np.ndarray):
+            raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+        
+        array = np.ascontiguousarray(obj)
+        payload = msgpack.packb({
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "data": array.data
+        }, use_bin_type=True)
+        return msgpack.ExtType(self.numpyExtType, payload)
+    
+    def _buildPacker(self, topic: str) -> Callable[[Dict[str, Any], str], bytes]:
+        """
+        Cria função especializada que formata, valida e serializa um tópico.
+        
+        Formatador, validação, packer e porções pré-serializadas ficam ligados
+        na closure, evitando lookups por mensagem. Para tópicos com labels fixos
+        só "ts" e "data" são serializados; o resultado é byte-a-byte igual a
+        msgpack.packb do dict completo.
+        
+        Args:
+            topic: Nome do tópico
+            
+        Returns:
+            Função (rawData, timestamp) -> bytes msgpack
+        """
+        
+        formatter = self.topicFormatters[topic]
+        validate = self._validateFormattedData
+        pack = self._packer.pack
+        header = self.topicHeaders.get(topic)
+        
+        if topic in self._PASSTHROUGH_TOPICS:
+            return self._buildPassthroughPacker(*self._PASSTHROUGH_TOPICS[topic])
+        
+        if header is None:
+            def packTopic(rawData: Dict[str, Any], timestamp: str) -> bytes:
+                formattedData = formatter(rawData, timestamp)
+                validate(topic, formattedData)
+                return pack(formattedData)
+            
+            return packTopic
+        
+        prefix, infix = header
+        labels = self.topicLabels[topic]
+        
+        def packStaticTopic(rawData: Dict[str, Any], timestamp: str) -> bytes:
+            formattedData = formatter(rawData, timestamp)
+            validate(topic, formattedData)
+            
+            if len(formattedData) != 3 or formattedData.get("labels") is not labels:
+                return pack(formattedData)
+            
+            return b"".join((prefix, pack(formattedData["ts"]), infix, pack(formattedData["data"])))
+        
+        return packStaticTopic
+    
     def _formatCameraFaceLandmarks(self, rawData: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """
         Formata dados de face landmarks da câmera.
@@ -158,8 +389,8 @@ class ZeroMQFormatter:
         if landmarks is None:
             raise ValueError("Landmarks are required for camera data")
         
-        if not isinstance(landmarks, list) or len(landmarks) != 478:
-            raise ValueError(f"Expected 478 landmarks, got {len(landmarks) if isinstance(landmarks, list) else 'not list'}")
+        if not isinstance(landmarks, (list, np.ndarray)) or len(landmarks) != 478:
+            raise ValueError(f"Expected 478 landmarks, got {len(landmarks) if isinstance(landmarks, (list, np.ndarray)) else 'not list'}")
         
         if ear is None or blinkRate is None:
             raise ValueError("EAR, blink_rate and confidence are required")
@@ -180,26 +411,28 @@ class ZeroMQFormatter:
         if not (-1.0 <= gazeDx <= 1.0 and -1.0 <= gazeDy <= 1.0):
             raise ValueError(f"Gaze vector ({gazeDx}, {gazeDy}) fora do range válido [-1.0, 1.0]")
         
-        # Flatten landmarks de [[x,y,z], ...] para [x1,y1,z1,x2,y2,z2,...]
-        landmarksFlat = []
-        for point in landmarks:
-            if not isinstance(point, list) or len(point) != 3:
-                raise ValueError(f"Each landmark must be [x, y, z], got {point}")
-            
-            # Verificar se coordenadas são válidas (assumindo normalizadas 0-1)
-            for coord in point:
-                if not (0.0 <= coord <= 1.0):
-                    raise ValueError(f"Landmark coordinate {coord} fora do range normalizado [0.0, 1.0]")
-            
-            landmarksFlat.extend([float(point[0]), float(point[1]), float(point[2])])
+        # Converter para array (478, 3) - validação e flatten vetorizados
+        try:
+            landmarksArray = np.asarray(landmarks, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise ValueError("Each landmark must be [x, y, z] with numeric coordinates")
+        
+        if landmarksArray.shape != (478, 3):
+            raise ValueError(f"Each landmark must be [x, y, z], got landmarks shape {landmarksArray.shape}")
+        
+        # Verificar coordenadas (normalizadas 0-1) e flatten de [[x,y,z], ...] para [x1,y1,z1,...]
+        coordsValid, landmarksFlatArray = _validateAndFlattenLandmarks(landmarksArray)
+        if not coordsValid:
+            raise ValueError(
+                f"Landmark coordinates [{landmarksFlatArray.min()}, {landmarksFlatArray.max()}] "
+                f"fora do range normalizado [0.0, 1.0]"
+            )
         
-        # Verificar tamanho final dos landmarks flattened
-        if len(landmarksFlat) != 1434:  # 478 * 3
-            raise ValueError(f"Flattened landmarks should have 1434 values, got {len(landmarksFlat)}")
+        landmarksFlat = landmarksFlatArray.tolist()  # 1434 valores
         
         return {
             "ts": timestamp,
-            "labels": ["landmarks", "gaze_dx", "gaze_dy", "ear", "blink_rate", "blink_counter", "frame_b64"],
+            "labels": self._LABELS_CAMERA,
             "data": [[
                 landmarksFlat,    # 1434 valores [x1,y1,z1,x2,y2,z2,...]
                 gazeDx,           # -1.0 a 1.0
@@ -239,13 +472,13 @@ class ZeroMQFormatter:
             raise ValueError("PPI value is required")
         
         # Validar range de PPI
-        validRange = self.zmqConfig.topicProcessingConfig["Polar_PPI"]["validPpiRange"]
+        validRange = self._polarPpiRange
         if not (validRange[0] <= ppi <= validRange[1]):
             raise ValueError(f"PPI {ppi} fora do range válido {validRange}")
         
         return {
             "ts": timestamp,
-            "labels": ["error_ms", "flags", "value"],
+            "labels": self._LABELS_PPI,
             "data": [[errorMs, flags, ppi]]
         }
     
@@ -277,23 +510,28 @@ class ZeroMQFormatter:
         if not isinstance(ecgValues, (list, np.ndarray)):
             raise ValueError("ECG values must be a list or array")
         
-        ecgList = list(ecgValues) if isinstance(ecgValues, np.ndarray) else ecgValues
+        ecgArray = np.asarray(ecgValues)  # Sem cópia se já for ndarray
         
         # LOD values (default to 0 se não fornecido)
+        sampleCount = len(ecgArray)
         if lodValues is None:
-            lodValues = [0] * len(ecgList)
-        elif len(lodValues) != len(ecgList):
-            # Estender ou truncar LOD para dar match à length do ECG
-            lodValues = (list(lodValues) + [0] * len(ecgList))[:len(ecgList)]
+            lodArray = np.zeros(sampleCount, dtype=np.int8)
+        else:
+            lodArray = np.asarray(lodValues)
+            if len(lodArray) != sampleCount:
+                # Estender com zeros ou truncar LOD para dar match à length do ECG
+                lodArray = lodArray[:sampleCount]
+                if len(lodArray) < sampleCount:
+                    lodArray = np.pad(lodArray, (0, sampleCount - len(lodArray)))
         
         # Criar array de dados com ECG e LOD intercalados
-        dataArray = []
-        for i in range(len(ecgList)):
-            dataArray.append([ecgList[i], lodValues[i]])
+        dataArray = _interleaveColumns((ecgArray, lodArray))
+        if not self.numpyExtEnabled:
+            dataArray = dataArray.tolist()
         
         return {
             "ts": timestamp,
-            "labels": ["ECG", "LOD"],
+            "labels": self._LABELS_ECG,
             "data": dataArray
         }
     
@@ -324,48 +562,26 @@ class ZeroMQFormatter:
         if any(v is None for v in [xValues, yValues, zValues]):
             raise ValueError("X, Y, Z values are required for accelerometer")
         
-        # Converter para listas se necessário
-        xList = list(xValues) if isinstance(xValues, np.ndarray) else xValues
-        yList = list(yValues) if isinstance(yValues, np.ndarray) else yValues
-        zList = list(zValues) if isinstance(zValues, np.ndarray) else zValues
+        # Converter para arrays NumPy
+        xArray = np.asarray(xValues)
+        yArray = np.asarray(yValues)
+        zArray = np.asarray(zValues)
         
         # Verificar se todos têm o mesmo comprimento
-        if not (len(xList) == len(yList) == len(zList)):
-            raise ValueError(f"All axes must have same length: X={len(xList)}, Y={len(yList)}, Z={len(zList)}")
+        if not (xArray.shape == yArray.shape == zArray.shape):
+            raise ValueError(f"All axes must have same length: X={len(xArray)}, Y={len(yArray)}, Z={len(zArray)}")
         
-        # Criar array de dados
-        dataArray = []
-        for i in range(len(xList)):
-            dataArray.append([xList[i], yList[i], zList[i]])
+        # Criar array de dados (transposição feita em C)
+        dataArray = _interleaveColumns((xArray, yArray, zArray))
+        if not self.numpyExtEnabled:
+            dataArray = dataArray.tolist()
         
         return {
             "ts": timestamp,
-            "labels": ["X", "Y", "Z"],
+            "labels": self._LABELS_XYZ,
             "data": dataArray
         }
     
-    def _formatCardioWheelGYR(self, rawData: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
-        """
-        Formata dados do giroscópio CardioWheel.
-        
-        Input esperado:
-        {
-            "x": [1, 2, ...],      # Valores ADC para eixo X
-            "y": [0, -1, ...],     # Valores ADC para eixo Y
-            "z": [2, 0, ...]       # Valores ADC para eixo Z
-        }
-        
-        Output ZeroMQ:
-        {
-            "ts": "timestamp", 
-            "labels": ["X", "Y", "Z"],
-            "data": [[1, 0, 2], [2, -1, 0], ...]
-        }
-        """
-        
-        # Reutilizar lógica do acelerómetro (formato idêntico)
-        return self._formatCardioWheelACC(rawData, timestamp)
-    
     def _formatBrainAccessEEG(self, rawData: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
         """
         Formata dados EEG do BrainAccess Halo.
@@ -387,7 +603,7 @@ class ZeroMQFormatter:
         """
         
         # Configuração EEG
-        expectedChannels = self.mockConfig.generatorBaseConfig["eeg"]["channelNames"]
+        expectedChannels = self._eegChannels
         
         # Extrair dados de cada canal
         channelData = {}
@@ -395,8 +611,7 @@ class ZeroMQFormatter:
             if channel not in rawData:
                 raise ValueError(f"EEG channel '{channel}' is required")
             
-            channelValues = rawData[channel]
-            channelData[channel] = list(channelValues) if isinstance(channelValues, np.ndarray) else channelValues
+            channelData[channel] = np.asarray(rawData[channel], dtype=self._eegDtype)
         
         # Verificar se todos os canais têm o mesmo comprimento
         lengths = [len(channelData[ch]) for ch in expectedChannels]
@@ -404,18 +619,13 @@ class ZeroMQFormatter:
             raise ValueError(f"All EEG channels must have same length: {dict(zip(expectedChannels, lengths))}")
         
         # Criar array de dados intercalando canais
-        dataArray = []
-        sampleCount = lengths[0]
-        
-        for i in range(sampleCount):
-            sample = []
-            for channel in expectedChannels:
-                sample.append(channelData[channel][i])
-            dataArray.append(sample)
+        dataArray = _interleaveColumns(tuple(channelData[channel] for channel in expectedChannels))
+        if not self.numpyExtEnabled:
+            dataArray = dataArray.tolist()
         
         return {
             "ts": timestamp,
-            "labels": expectedChannels,
+            "labels": self.topicLabels["BrainAcess_EEG"],
             "data": dataArray
         }
     
@@ -443,13 +653,13 @@ class ZeroMQFormatter:
             raise ValueError("Alcohol level is required for Unity alcohol data")
         
         # Validar range usando configurações centralizadas
-        validRange = self.zmqConfig.topicValidationConfig["Unity_Alcohol"]["valueRanges"]["alcohol_level"]
+        validRange = self._alcoholRange
         if not (validRange[0] <= alcoholLevel <= validRange[1]):
             raise ValueError(f"Alcohol level {alcoholLevel} fora do range válido {validRange}")
         
         return {
             "ts": timestamp,
-            "labels": ["alcohol_level"],
+            "labels": self._LABELS_ALCOHOL,
             "data": [[float(alcoholLevel)]]
         }
     
@@ -479,64 +689,40 @@ class ZeroMQFormatter:
             raise ValueError("Speed and lane_centrality are required for Unity car info")
         
         # Validar ranges usando configurações centralizadas
-        carInfoValidation = self.zmqConfig.topicValidationConfig["Unity_CarInfo"]["valueRanges"]
-        
-        speedRange = carInfoValidation["speed"]
+        speedRange = self._speedRange
         if not (speedRange[0] <= speed <= speedRange[1]):
             raise ValueError(f"Speed {speed} fora do range válido {speedRange}")
         
-        centralityRange = carInfoValidation["lane_centrality"]
+        centralityRange = self._centralityRange
         if not (centralityRange[0] <= laneCentrality <= centralityRange[1]):
             raise ValueError(f"Lane centrality {laneCentrality} fora do range válido {centralityRange}")
         
         return {
             "ts": timestamp,
-            "labels": ["speed", "lane_centrality"], 
+            "labels": self._LABELS_CAR,
             "data": [[float(speed), float(laneCentrality)]]
         }
 
-    def _formatSystemControl(self, rawData: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
-        """
-        Formata mensagens de controlo do sistema.
-        
-        Input: qualquer dict
-        Output: formato básico com timestamp
+    def _formatPassthrough(self, key: str, includeTimestamp: bool, rawData: Any, timestamp: str) -> Dict[str, Any]:
         """
-        
-        return {
-            "ts": timestamp,
-            "control": rawData
-        }
-    
-    def _formatSystemTimestamp(self, rawData: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
-        """
-        Formata mensagens de timestamp do sistema.
-        
-        Input: qualquer dict
-        Output: formato básico com timestamp
-        """
-        
-        return {
-            "ts": timestamp,
-            "system_timestamp": rawData
-        }
-    
-    def _formatSystemConfig(self, rawData: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
-        """
-        Formata mensagens de configuração do sistema.
+        Formata mensagens de sistema (Control, Timestamp, Cfg).
         
         Input: qualquer dict
-        Output: formato básico
+        Output: payload sob chave fixa, com timestamp exceto em Cfg
         """
         
-        return {
-            "config": rawData
-        }
+        if includeTimestamp:
+            return {"ts": timestamp, key: rawData}
+        return {key: rawData}
     
     def _validateFormattedData(self, topic: str, formattedData: Dict[str, Any]) -> None:
         """
         Valida estrutura dos dados formatados antes de serializar.
         
+        Os formatadores são determinísticos: fora do modo strictValidation, depois
+        da primeira validação bem-sucedida de um tópico só é validada uma mensagem
+        em cada validateEveryN.
+        
         Args:
             topic: Nome do tópico
             formattedData: Dados formatados para validar
@@ -545,6 +731,10 @@ class ZeroMQFormatter:
             ValueError: Se estrutura inválida
         """
         
+        if (not self.strictValidation and topic in self._validatedTopics
+                and self._formattedCounts[self._topicIndex[topic]] % self.validateEveryN != 0):
+            return
+        
         if topic not in self.validationConfig:
             # Se não há config de validação, só verificar estrutura básica
             if not isinstance(formattedData, dict):
@@ -567,17 +757,44 @@ class ZeroMQFormatter:
             if not isinstance(labels, list):
                 raise ValueError("Labels must be a list")
             
-            if not isinstance(data, list):
+            if isinstance(data, np.ndarray):
+                # Array 2D (modo ExtType) - validar dimensões sem percorrer linhas
+                if data.ndim != 2 or data.shape[1] != len(labels):
+                    raise ValueError(f"Data array has shape {data.shape}, expected (N, {len(labels)})")
+            
+            elif not isinstance(data, list):
                 raise ValueError("Data must be a list")
             
             # Verificar se data tem estrutura correta
-            if data and isinstance(data[0], list):
+            elif data and isinstance(data[0], list):
                 expectedColumns = len(labels)
                 for i, row in enumerate(data):
                     if len(row) != expectedColumns:
                         raise ValueError(f"Data row {i} has {len(row)} columns, expected {expectedColumns}")
         
-        self.logger.debug(f"Validation passed for topic '{topic}'")
+        self._validatedTopics.add(topic)
+        self.logger.debug("Validation passed for topic '%s'", topic)
+    
+    def _resetStats(self) -> None:
+        """
+        Inicializa estatísticas de formatação.
+        
+        Os contadores de sucesso ficam em arrays indexados por _topicIndex
+        (incremento barato no caminho quente); os erros ficam em self.stats.
+        O formato dict completo é materializado em getStats().
+        """
+        
+        topicCount = len(self._topicIndex)
+        self._totalFormatted = 0
+        self._formattedCounts = array.array('Q', [0] * topicCount)
+        self._lastFormattedTimes = array.array('d', [0.0] * topicCount)
+        self.stats = {
+            "totalErrors": 0,
+            "byTopic": {topic: {
+                "errors": 0,
+                "lastError": None
+            } for topic in self._topicIndex}
+        }
     
     def _updateStats(self, topic: str, success: bool, error: str = None) -> None:
         """
@@ -590,10 +807,10 @@ class ZeroMQFormatter:
         """
         
         if success:
-            self.stats["totalFormatted"] += 1
-            if topic in self.stats["byTopic"]:
-                self.stats["byTopic"][topic]["formatted"] += 1
-                self.stats["byTopic"][topic]["lastFormatted"] = datetime.now().isoformat()
+            index = self._topicIndex[topic]
+            self._totalFormatted += 1
+            self._formattedCounts[index] += 1
+            self._lastFormattedTimes[index] = time.time()  # Convertido para ISO em getStats()
         else:
             self.stats["totalErrors"] += 1
             if topic in self.stats["byTopic"]:
@@ -611,14 +828,24 @@ class ZeroMQFormatter:
             Estatísticas detalhadas por tópico
         """
         
+        byTopic = {}
+        for topic, index in self._topicIndex.items():
+            lastFormatted = self._lastFormattedTimes[index]
+            byTopic[topic] = {
+                "formatted": self._formattedCounts[index],
+                "errors": self.stats["byTopic"][topic]["errors"],
+                "lastFormatted": datetime.fromtimestamp(lastFormatted).isoformat() if lastFormatted else None,
+                "lastError": self.stats["byTopic"][topic]["lastError"]
+            }
+        
         return {
-            "totalFormatted": self.stats["totalFormatted"],
+            "totalFormatted": self._totalFormatted,
             "totalErrors": self.stats["totalErrors"],
             "successRate": (
-                self.stats["totalFormatted"] / 
-                max(1, self.stats["totalFormatted"] + self.stats["totalErrors"])
+                self._totalFormatted / 
+                max(1, self._totalFormatted + self.stats["totalErrors"])
             ),
-            "byTopic": self.stats["byTopic"].copy(),
+            "byTopic": byTopic,
             "supportedTopics": list(self.topicFormatters.keys()),
             "lastUpdate": datetime.now().isoformat()
         }
@@ -634,23 +861,15 @@ class ZeroMQFormatter:
             True se tópico é suportado
         """
         
-        return topic in self.topicFormatters
+        return topic in self._supportedTopics
     
     def reset(self) -> None:
         """
         Reset das estatísticas de formatação.
         """
         
-        self.stats = {
-            "totalFormatted": 0,
-            "totalErrors": 0,
-            "byTopic": {topic: {
-                "formatted": 0,
-                "errors": 0,
-                "lastFormatted": None,
-                "lastError": None
-            } for topic in self.topicFormatters.keys()}
-        }
+        self._resetStats()
+        self._validatedTopics.clear()
         
         self.logger.info("ZeroMQFormatter statistics reset")
 
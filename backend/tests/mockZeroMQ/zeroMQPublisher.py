@@ -8,12 +8,15 @@ permitindo que o ZeroMQListener receba dados como se fossem de sensores reais.
 Mantém métricas de publicação e permite controlo granular por tópico.
 """
 
+import array
 import asyncio
 import logging
+import time
+import msgpack
 import zmq
-import zmq.asyncio
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, Optional, Set
+from typing import Deque, Dict, Any, Optional, Set, Tuple
 from enum import Enum
 
 from app.core import settings, eventManager
@@ -27,9 +30,31 @@ class PublisherState(Enum):
     STOPPING = "stopping"
     ERROR = "error"
 
+# Estado pré-resolvido para comparação por identidade no caminho de publicação
+_RUNNING = PublisherState.RUNNING
+
 class ZeroMQPublisher:
     """Publisher mock para simular dados de sensores via ZeroMQ"""
     
+    # Atributos fixos (acesso por slot no caminho de publicação, sem __dict__)
+    __slots__ = (
+        'logger',
+        # Conexão e socket
+        'publisherAddress', 'publisherPort', 'publisherUrl',
+        'lingerTime', 'sendHighWaterMark', 'sendBufferSize', 'tcpKeepalive', 'ioThreads', 'socketType',
+        'maxMessagesPerSecond', 'maxMessageSize', 'batchSendEnabled',
+        # Estado
+        'state', 'startTime', 'availableTopics', '_topicSet', 'activeTopics',
+        'context', 'socket', '_topicIdx', '_topicBytes', '_packer',
+        '_loop', '_sendQueue', '_flusherTask', '_inFlightBatch', '_wallClockAnchor',
+        # Estatísticas
+        'stats', '_sentArr', '_bytesArr', '_errArr', '_lastSentArr',
+        '_lastMessageTimestampNs', '_pendingBatch',
+        '_emitBatchSize', '_emitBatchInterval', '_lastBatchEmitTime',
+        # Rate limiting
+        '_tokenBurst', '_tokens', '_lastRefillNs'
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
@@ -44,42 +69,64 @@ class ZeroMQPublisher:
         # Configurações de socket
         self.lingerTime = mockConfig.mockLingerTime
         self.sendHighWaterMark = mockConfig.mockSendHighWaterMark
+        self.sendBufferSize = mockConfig.mockSendBufferSize
+        self.tcpKeepalive = mockConfig.mockTcpKeepalive
+        self.ioThreads = mockConfig.mockIoThreads
         self.socketType = "PUB"
         
         # Configurações de performance
         self.maxMessagesPerSecond = mockConfig.performanceConfig["maxMessagesPerSecond"]
         self.maxMessageSize = mockConfig.performanceConfig["maxMessageSize"]
         
+        # Buffer de envio do kernel coerente com o HWM (rajadas não esgotam o buffer)
+        self.sendBufferSize = max(self.sendBufferSize, self.sendHighWaterMark * self.maxMessageSize)
+        self.batchSendEnabled = mockConfig.performanceConfig["batchSendEnabled"]
+        
         # Estado do publisher
         self.state = PublisherState.STOPPED
         self.startTime: Optional[datetime] = None
         self.availableTopics = settings.signalControl.zeroMQTopics.copy()
+        self._topicSet = frozenset(self.availableTopics)  # Verificação O(1); a lista mantém a ordem
         defaultActiveStates = settings.signalControl.defaultActiveStates["publisher"]
         self.activeTopics: Set[str] = {signal for signal, active in defaultActiveStates.items() if active}
         
-        # Componentes ZeroMQ
-        self.context: Optional[zmq.asyncio.Context] = None
-        self.socket: Optional[zmq.asyncio.Socket] = None
+        # Índice fixo por tópico para as estatísticas em arrays paralelos
+        self._topicIdx: Dict[str, int] = {topic: i for i, topic in enumerate(sorted(self.availableTopics))}
+        
+        # Tópicos pré-codificados (conjunto fixo, evita encode por mensagem)
+        self._topicBytes: Dict[str, bytes] = {topic: topic.encode('utf-8') for topic in self.availableTopics}
+        
+        # Componentes ZeroMQ (socket síncrono: PUB com NOBLOCK nunca bloqueia, descarta no HWM)
+        self.context: Optional[zmq.Context] = None
+        self.socket: Optional[zmq.Socket] = None
+        
+        # Packer msgpack reutilizado em publishToTopic
+        self._packer = msgpack.Packer(use_bin_type=True)
+        
+        # Event loop em que o publisher corre (resolvido em start())
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Envio em lote: fila de mensagens pendentes drenada por uma única task
+        self._sendQueue: Optional[asyncio.Queue] = None
+        self._flusherTask: Optional[asyncio.Task] = None
+        # Lote já retirado da fila e ainda não enviado (recuperado por _stopFlusher se houver stop)
+        self._inFlightBatch: Optional[Deque[Tuple[str, bytes]]] = None
+        
+        # Âncora monotónico/relógio de parede para converter timestamps em ISO na leitura
+        self._wallClockAnchor: Tuple[int, float] = (time.monotonic_ns(), time.time())
         
         # Estatísticas de publicação por tópico
-        self.stats = {
-            "messagesSent": 0,
-            "bytesSent": 0,
-            "messagesPerSecond": 0.0,
-            "lastMessageTimestamp": None,
-            "errors": 0,
-            "topicStats": {topic: {
-                "sent": 0,
-                "bytes": 0,
-                "lastSent": None,
-                "errors": 0
-            } for topic in self.availableTopics},
-            "startTime": None
-        }
+        self._resetStats(startTime=None)
         
-        # Rate limiting
-        self.lastMessageTime = 0.0
-        self.messageInterval = 1.0 / self.maxMessagesPerSecond
+        # Eventos de envio agregados (um evento a cada N mensagens ou intervalo)
+        self._emitBatchSize = 256
+        self._emitBatchInterval = 0.1
+        self._lastBatchEmitTime = 0.0
+        
+        # Rate limiting (token bucket: reposição a maxMessagesPerSecond, rajada de 100ms)
+        self._tokenBurst = max(1.0, self.maxMessagesPerSecond * 0.1)
+        self._tokens = self._tokenBurst
+        self._lastRefillNs = time.monotonic_ns()
         
         self.logger.info(f"ZeroMQPublisher initialized - URL: {self.publisherUrl}, Topics: {len(self.availableTopics)}")
     
@@ -97,21 +144,29 @@ class ZeroMQPublisher:
         self.logger.info("Starting ZeroMQ PUB publisher...")
         self.state = PublisherState.STARTING
         self.startTime = datetime.now()
+        self._loop = asyncio.get_running_loop()
+        self._wallClockAnchor = (time.monotonic_ns(), time.time())
         
         try:
             # Criar contexto e socket ZeroMQ
-            self.context = zmq.asyncio.Context()
+            self.context = zmq.Context(io_threads=self.ioThreads)
             self.socket = self.context.socket(zmq.PUB)
             
             # Configurar parâmetros do socket
             self.socket.setsockopt(zmq.LINGER, self.lingerTime)
             self.socket.setsockopt(zmq.SNDHWM, self.sendHighWaterMark)
+            self.socket.setsockopt(zmq.SNDBUF, self.sendBufferSize)
+            self.socket.setsockopt(zmq.IMMEDIATE, 1)
+            self.socket.setsockopt(zmq.TCP_KEEPALIVE, self.tcpKeepalive)
             
-            # Bind ao endereço configurado
+            # Bind ao endereço configurado (síncrono: socket pronto quando retorna)
             self.socket.bind(self.publisherUrl)
             
-            # Aguardar breve para socket estabilizar
-            await asyncio.sleep(0.1)
+            # Iniciar task de envio em lote
+            if self.batchSendEnabled:
+                # Fila limitada ao HWM do socket: backpressure em vez de crescimento sem limite
+                self._sendQueue = asyncio.Queue(maxsize=self.sendHighWaterMark)
+                self._flusherTask = asyncio.create_task(self._flushLoop())
             
             # Atualizar estado
             self.state = PublisherState.RUNNING
@@ -145,6 +200,9 @@ class ZeroMQPublisher:
         self.state = PublisherState.STOPPING
         
         try:
+            # Parar envio em lote e enviar mensagens ainda pendentes
+            await self._stopFlusher()
+            
             # Fechar socket e contexto
             await self._disconnect()
             
@@ -152,7 +210,7 @@ class ZeroMQPublisher:
             await eventManager.emit("mock.publisher_stopped", {
                 "timestamp": datetime.now().isoformat(),
                 "uptime": self._getUptime(),
-                "finalStats": self.stats.copy()
+                "finalStats": self._buildStats()
             })
             
             self.state = PublisherState.STOPPED
@@ -172,66 +230,87 @@ class ZeroMQPublisher:
             data: Dados serializados (msgpack) para publicar
             
         Returns:
-            True se enviado com sucesso, False caso contrário
+            True se a mensagem foi aceite para envio. Em modo lote (batchSendEnabled)
+            significa que ficou na fila (False se a fila estiver cheia); descartes por
+            buffer cheio (zmq.Again) ou erros de envio posteriores só aparecem nas
+            estatísticas do publisher. Em modo direto, True se enviada e False se
+            descartada ou com erro.
             
         Raises:
-            ZeroMQError: Se publisher não estiver ativo ou erro de envio
+            ZeroMQError: Se publisher não estiver ativo ou dados/tópico inválidos
         """
-        if self.state != PublisherState.RUNNING:
+        self._checkReady(topic, data)
+        
+        # Rate limiting (só suspende se não houver tokens)
+        await self._acquireToken()
+        
+        # Modo em lote: enfileirar e deixar a task de envio publicar
+        if self._sendQueue is not None:
+            try:
+                self._sendQueue.put_nowait((topic, data))
+            except asyncio.QueueFull:
+                # Fila cheia (mesmo limite que o SNDHWM) - descartar como num zmq.Again
+                self.logger.warning(f"Send queue full for topic '{topic}', message dropped")
+                self._errArr[self._topicIdx[topic]] += 1
+                return False
+            return True
+        
+        # Publicar mensagem multipart (tópico + dados)
+        if not await self._sendFrames(topic, data):
+            return False
+        
+        # Atualizar estatísticas
+        self._updateStats(topic, len(data))
+        
+        self.logger.debug(f"Published message to topic '{topic}': {len(data)} bytes")
+        
+        # Emitir evento agregado quando o lote pendente estiver completo
+        await self._emitPendingBatch()
+        
+        return True
+    
+    def _checkReady(self, topic: str, data: bytes):
+        """
+        Valida pré-condições de publicação.
+        
+        Args:
+            topic: Nome do tópico ZeroMQ
+            data: Dados serializados
+            
+        Raises:
+            ZeroMQError: Se publisher não estiver ativo ou mensagem inválida
+        """
+        if self.state is not _RUNNING:
             raise ZeroMQError("publish", f"Publisher not running (state: {self.state.value})")
         
-        if topic not in self.availableTopics:
+        if topic not in self._topicSet:
             raise ZeroMQError("publish", f"Unknown topic: {topic}. Available: {list(self.availableTopics)}")
         
-        if not isinstance(data, bytes):
+        # Verificação de tipo removida com python -O (o formatter produz sempre bytes)
+        if __debug__ and not isinstance(data, bytes):
             raise ZeroMQError("publish", f"Data must be bytes, got {type(data)}")
         
         if len(data) > self.maxMessageSize:
             raise ZeroMQError("publish", f"Message too large: {len(data)} > {self.maxMessageSize}")
+    
+    async def _acquireToken(self):
+        """
+        Obtém um token do rate limiter, aguardando apenas se o bucket estiver vazio.
         
-        try:
-            # Rate limiting simples
-            currentTime = asyncio.get_event_loop().time()
-            timeSinceLastMessage = currentTime - self.lastMessageTime
-            
-            if timeSinceLastMessage < self.messageInterval:
-                sleepTime = self.messageInterval - timeSinceLastMessage
-                await asyncio.sleep(sleepTime)
-            
-            # Publicar mensagem multipart (tópico + dados)
-            await self.socket.send_multipart([
-                topic.encode('utf-8'),  # Tópico como bytes
-                data                    # Dados já em bytes
-            ], zmq.NOBLOCK)
-            
-            # Atualizar estatísticas
-            self._updateStats(topic, len(data))
-            self.lastMessageTime = asyncio.get_event_loop().time()
-            
-            self.logger.debug(f"Published message to topic '{topic}': {len(data)} bytes")
-            
-            # Emitir evento de mensagem enviada
-            await eventManager.emit("mock.message_sent", {
-                "timestamp": datetime.now().isoformat(),
-                "topic": topic,
-                "messageSize": len(data),
-                "totalSent": self.stats["messagesSent"]
-            })
-            
-            return True
+        Reposição e consumo não têm await entre si, por isso são atómicos no
+        event loop; chamadores concorrentes abaixo do limite nunca dormem.
+        """
+        while True:
+            now = time.monotonic_ns()
+            elapsed = (now - self._lastRefillNs) / 1e9
+            self._tokens = min(self._tokenBurst, self._tokens + elapsed * self.maxMessagesPerSecond)
+            self._lastRefillNs = now
             
-        except zmq.Again:
-            # Buffer cheio - não é erro crítico
-            self.logger.warning(f"Send buffer full for topic '{topic}', message dropped")
-            self.stats["topicStats"][topic]["errors"] += 1
-            return False
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
             
-        except Exception as e:
-            self.logger.error(f"Error publishing to topic '{topic}': {e}")
-            self.stats["errors"] += 1
-            self.stats["topicStats"][topic]["errors"] += 1
-            await self._emitError("publish_failed", f"Topic '{topic}': {e}")
-            return False
+            await asyncio.sleep((1.0 - self._tokens) / self.maxMessagesPerSecond)
     
     async def publishToTopic(self, topic: str, formattedData: Dict[str, Any]) -> bool:
         """
@@ -246,8 +325,7 @@ class ZeroMQPublisher:
         """
         try:
             # Serializar dados para msgpack (será feito pelo ZeroMQFormatter)
-            import msgpack
-            serializedData = msgpack.packb(formattedData, use_bin_type=True)
+            serializedData = self._packer.pack(formattedData)
             
             return await self.publishMessage(topic, serializedData)
             
@@ -256,6 +334,142 @@ class ZeroMQPublisher:
             self.stats["errors"] += 1
             return False
     
+    async def _sendFrames(self, topic: str, data: bytes) -> bool:
+        """
+        Envia [tópico, dados] como mensagem multipart com duas chamadas send diretas.
+        
+        O formato de duas frames é o do PC Publisher real (o listener faz
+        recv_multipart), por isso não é fundido numa só frame. O tópico é
+        pequeno e vai copiado; os dados (bytes imutáveis) vão sem cópia.
+        Mensagens multipart são atómicas: se a primeira frame for aceite a
+        segunda também é. Falhas de envio são contabilizadas aqui.
+        
+        Args:
+            topic: Nome do tópico
+            data: Dados serializados
+            
+        Returns:
+            True se enviado, False se descartado ou erro
+        """
+        try:
+            send = self.socket.send
+            send(self._topicBytes[topic], zmq.NOBLOCK | zmq.SNDMORE)
+            send(data, zmq.NOBLOCK, copy=False, track=False)
+            return True
+            
+        except zmq.Again:
+            # Buffer cheio - não é erro crítico
+            self.logger.warning(f"Send buffer full for topic '{topic}', message dropped")
+            self._errArr[self._topicIdx[topic]] += 1
+            return False
+            
+        except Exception as e:
+            self.logger.error(f"Error publishing to topic '{topic}': {e}")
+            self.stats["errors"] += 1
+            self._errArr[self._topicIdx[topic]] += 1
+            await self._emitError("publish_failed", f"Topic '{topic}': {e}")
+            return False
+    
+    async def _flushLoop(self):
+        """
+        Drena a fila de envio: aguarda a primeira mensagem, cede um ciclo do
+        event loop para os restantes produtores do mesmo tick enfileirarem, e
+        envia de seguida todas as que estiverem pendentes.
+        """
+        try:
+            while True:
+                # O lote fica em self para que um stop() durante os awaits seguintes não o perca
+                batch = self._inFlightBatch = deque([await self._sendQueue.get()])
+                
+                # Coalescer mensagens que chegam no mesmo tick do event loop
+                await asyncio.sleep(0)
+                
+                while not self._sendQueue.empty():
+                    batch.append(self._sendQueue.get_nowait())
+                
+                await self._sendBatch(batch)
+                self._inFlightBatch = None
+                
+        except asyncio.CancelledError:
+            self.logger.debug("Publisher flush loop cancelled")
+    
+    async def _sendBatch(self, batch: Deque[Tuple[str, bytes]]):
+        """
+        Envia um lote de mensagens multipart sem bloquear.
+        
+        Cada mensagem só é removida do lote depois de enviada, pelo que o que
+        restar no lote após um cancelamento ainda não saiu.
+        
+        Args:
+            batch: Fila de pares (tópico, dados serializados), consumida pela frente
+        """
+        batchSize = len(batch)
+        while batch:
+            topic, data = batch[0]
+            if await self._sendFrames(topic, data):
+                self._updateStats(topic, len(data))
+            batch.popleft()
+        
+        self.logger.debug("Published batch of %d messages", batchSize)
+        
+        await self._emitPendingBatch()
+    
+    async def _emitPendingBatch(self, force: bool = False):
+        """
+        Emite evento agregado das mensagens enviadas desde o último evento.
+        
+        Só emite quando o lote atinge _emitBatchSize mensagens ou passou
+        _emitBatchInterval desde o último evento (ou sempre, com force).
+        
+        Args:
+            force: Emitir mesmo que o lote não esteja completo
+        """
+        pending = self._pendingBatch
+        if pending["count"] == 0:
+            return
+        
+        currentTime = self._loop.time()
+        if (not force and pending["count"] < self._emitBatchSize
+                and currentTime - self._lastBatchEmitTime < self._emitBatchInterval):
+            return
+        
+        self._pendingBatch = {"count": 0, "bytes": 0, "topics": {}}
+        self._lastBatchEmitTime = currentTime
+        
+        await eventManager.emit("mock.messages_sent_batch", {
+            "timestamp": datetime.now().isoformat(),
+            "messageCount": pending["count"],
+            "bytesSent": pending["bytes"],
+            "topics": pending["topics"],
+            "totalSent": self.stats["messagesSent"]
+        })
+    
+    async def _stopFlusher(self):
+        """
+        Cancela a task de envio em lote e envia as mensagens pendentes:
+        primeiro o lote que a task já tinha retirado da fila, depois o resto da fila.
+        """
+        if self._flusherTask:
+            self._flusherTask.cancel()
+            try:
+                await self._flusherTask
+            except asyncio.CancelledError:
+                pass
+            self._flusherTask = None
+        
+        pending = self._inFlightBatch or deque()
+        self._inFlightBatch = None
+        
+        if self._sendQueue is not None:
+            while not self._sendQueue.empty():
+                pending.append(self._sendQueue.get_nowait())
+            self._sendQueue = None
+        
+        if pending and self.socket:
+            await self._sendBatch(pending)
+        
+        await self._emitPendingBatch(force=True)
+    
     async def _disconnect(self):
         """
         Fecha socket e termina contexto ZeroMQ de forma segura.
@@ -269,13 +483,39 @@ class ZeroMQPublisher:
                 self.context.term()
                 self.context = None
             
-            self.activeTopics.clear()
             self.logger.debug("ZeroMQ PUB socket closed")
             
         except Exception as e:
             self.logger.error(f"Error closing ZeroMQ socket: {e}")
             self.stats["errors"] += 1
     
+    def _resetStats(self, startTime: Optional[str]):
+        """
+        Inicializa estatísticas de publicação.
+        
+        As estatísticas por tópico ficam em arrays paralelos indexados por
+        _topicIdx; timestamps de envio ficam em nanosegundos monotónicos.
+        O formato dict completo (com ISO) é materializado em _buildStats().
+        
+        Args:
+            startTime: Início do publisher em ISO (None se parado)
+        """
+        self.stats = {
+            "messagesSent": 0,
+            "bytesSent": 0,
+            "lastMessageTimestamp": None,
+            "errors": 0,
+            "startTime": startTime
+        }
+        
+        topicCount = len(self._topicIdx)
+        self._sentArr = array.array('Q', [0] * topicCount)
+        self._bytesArr = array.array('Q', [0] * topicCount)
+        self._errArr = array.array('Q', [0] * topicCount)
+        self._lastSentArr = array.array('q', [0] * topicCount)
+        self._lastMessageTimestampNs = 0
+        self._pendingBatch = {"count": 0, "bytes": 0, "topics": {}}
+    
     def _updateStats(self, topic: str, messageSize: int):
         """
         Atualiza estatísticas de publicação.
@@ -284,28 +524,92 @@ class ZeroMQPublisher:
             topic: Tópico da mensagem
             messageSize: Tamanho da mensagem em bytes
         """
-        now = datetime.now()
+        now = time.monotonic_ns()
         
         # Estatísticas globais
         self.stats["messagesSent"] += 1
         self.stats["bytesSent"] += messageSize
-        self.stats["lastMessageTimestamp"] = now.isoformat()
+        self._lastMessageTimestampNs = now
         
         # Estatísticas por tópico
-        if topic in self.stats["topicStats"]:
-            topicStats = self.stats["topicStats"][topic]
-            topicStats["sent"] += 1
-            topicStats["bytes"] += messageSize
-            topicStats["lastSent"] = now.isoformat()
+        index = self._topicIdx[topic]
+        self._sentArr[index] += 1
+        self._bytesArr[index] += messageSize
+        self._lastSentArr[index] = now
+        
+        # Marcar tópico como ativo só na primeira mensagem desde o reset
+        if self._sentArr[index] == 1:
+            self.activeTopics.add(topic)
+        
+        # Acumular no lote do próximo evento de envio
+        pending = self._pendingBatch
+        pending["count"] += 1
+        pending["bytes"] += messageSize
+        pending["topics"][topic] = pending["topics"].get(topic, 0) + 1
+    
+    def _monotonicToIso(self, timestampNs: int) -> Optional[str]:
+        """
+        Converte timestamp monotónico em ISO usando a âncora de relógio de parede.
         
-        # Adicionar à lista de tópicos ativos
-        self.activeTopics.add(topic)
+        Args:
+            timestampNs: Timestamp de time.monotonic_ns() (0 se nunca registado)
+            
+        Returns:
+            Timestamp ISO ou None
+        """
+        if not timestampNs:
+            return None
+        anchorNs, anchorWall = self._wallClockAnchor
+        return datetime.fromtimestamp(anchorWall + (timestampNs - anchorNs) / 1e9).isoformat()
+    
+    def _getMessagesPerSecond(self, uptime: Optional[float] = None) -> float:
+        """
+        Calcula mensagens por segundo desde o início do publisher (na leitura).
         
-        # Calcular mensagens por segundo (rolling average simples)
-        if self.startTime:
+        Args:
+            uptime: Uptime já calculado pelo chamador (recalculado se None)
+            
+        Returns:
+            Taxa média de envio
+        """
+        if not self.startTime:
+            return 0.0
+        if uptime is None:
             uptime = self._getUptime()
-            if uptime > 0:
-                self.stats["messagesPerSecond"] = self.stats["messagesSent"] / uptime
+        return self.stats["messagesSent"] / max(uptime, 1e-9)
+    
+    def _minimalStats(self) -> Dict[str, Any]:
+        """
+        Contadores globais apenas (sem topicStats), para eventos frequentes.
+        
+        Returns:
+            Dicionário com contadores escalares
+        """
+        return {
+            "messagesSent": self.stats["messagesSent"],
+            "bytesSent": self.stats["bytesSent"],
+            "errors": self.stats["errors"]
+        }
+    
+    def _buildStats(self) -> Dict[str, Any]:
+        """
+        Materializa estatísticas com timestamps ISO (caminho frio).
+        
+        Returns:
+            Cópia das estatísticas no formato de publicação
+        """
+        stats = self.stats.copy()
+        stats["messagesPerSecond"] = self._getMessagesPerSecond()
+        stats["lastMessageTimestamp"] = self._monotonicToIso(self._lastMessageTimestampNs)
+        stats["topicStats"] = {
+            topic: {
+                "sent": self._sentArr[index],
+                "bytes": self._bytesArr[index],
+                "lastSent": self._monotonicToIso(self._lastSentArr[index]),
+                "errors": self._errArr[index]
+            } for topic, index in self._topicIdx.items()
+        }
+        return stats
     
     async def _emitError(self, errorType: str, message: str):
         """
@@ -320,7 +624,7 @@ class ZeroMQPublisher:
             "errorType": errorType,
             "message": message,
             "state": self.state.value,
-            "stats": self.stats.copy()
+            "stats": self._minimalStats()
         })
     
     def _getUptime(self) -> float:
@@ -348,14 +652,16 @@ class ZeroMQPublisher:
             "uptime": self._getUptime(),
             "availableTopics": list(self.availableTopics),
             "activeTopics": list(self.activeTopics),
-            "stats": self.stats.copy(),
+            "stats": self._buildStats(),
             "config": {
                 "publisherAddress": self.publisherAddress,
                 "publisherPort": self.publisherPort,
                 "maxMessagesPerSecond": self.maxMessagesPerSecond,
                 "maxMessageSize": self.maxMessageSize,
                 "lingerTime": self.lingerTime,
-                "sendHighWaterMark": self.sendHighWaterMark
+                "sendHighWaterMark": self.sendHighWaterMark,
+                "sendBufferSize": self.sendBufferSize,
+                "ioThreads": self.ioThreads
             }
         }
     
@@ -370,6 +676,11 @@ class ZeroMQPublisher:
         issues = []
         warnings = []
         
+        # Métricas calculadas uma vez por chamada
+        messagesSent = self.stats["messagesSent"]
+        errorRate = self.stats["errors"] / max(1, messagesSent)
+        uptime = self._getUptime()
+        
         # Verificar estado
         if self.state == PublisherState.ERROR:
             health = "critical"
@@ -379,16 +690,14 @@ class ZeroMQPublisher:
             warnings.append(f"Publisher not running (state: {self.state.value})")
         
         # Verificar tópicos ativos
-        if len(self.activeTopics) == 0 and self._getUptime() > 5.0:
+        if len(self.activeTopics) == 0 and uptime > 5.0:
             health = "warning" if health == "healthy" else health
             warnings.append("No active topics after 5s")
         
         # Verificar taxa de erro
-        if self.stats["messagesSent"] > 0:
-            errorRate = self.stats["errors"] / self.stats["messagesSent"]
-            if errorRate > 0.1:  # >10% erro
-                health = "warning" if health == "healthy" else health
-                warnings.append(f"High error rate: {errorRate:.1%}")
+        if messagesSent > 0 and errorRate > 0.1:  # >10% erro
+            health = "warning" if health == "healthy" else health
+            warnings.append(f"High error rate: {errorRate:.1%}")
         
         return {
             "health": health,
@@ -396,8 +705,8 @@ class ZeroMQPublisher:
             "warnings": warnings,
             "lastCheck": datetime.now().isoformat(),
             "metrics": {
-                "errorRate": self.stats["errors"] / max(1, self.stats["messagesSent"]),
-                "messagesPerSecond": self.stats["messagesPerSecond"],
+                "errorRate": errorRate,
+                "messagesPerSecond": self._getMessagesPerSecond(uptime),
                 "activeTopicsCount": len(self.activeTopics),
                 "totalTopicsCount": len(self.availableTopics)
             }
@@ -406,21 +715,27 @@ class ZeroMQPublisher:
     def reset(self):
         """
         Reset das estatísticas de publicação.
+        
+        Dicts e arrays existentes são reutilizados (sem realocar entradas por
+        tópico); leituras externas recebem sempre cópias via _buildStats().
         """
-        self.stats = {
-            "messagesSent": 0,
-            "bytesSent": 0,
-            "messagesPerSecond": 0.0,
-            "lastMessageTimestamp": None,
-            "errors": 0,
-            "topicStats": {topic: {
-                "sent": 0,
-                "bytes": 0,
-                "lastSent": None,
-                "errors": 0
-            } for topic in self.availableTopics},
-            "startTime": datetime.now().isoformat() if self.state == PublisherState.RUNNING else None
-        }
+        stats = self.stats
+        stats["messagesSent"] = 0
+        stats["bytesSent"] = 0
+        stats["lastMessageTimestamp"] = None
+        stats["errors"] = 0
+        stats["startTime"] = datetime.now().isoformat() if self.state == PublisherState.RUNNING else None
+        
+        for index in range(len(self._topicIdx)):
+            self._sentArr[index] = 0
+            self._bytesArr[index] = 0
+            self._errArr[index] = 0
+            self._lastSentArr[index] = 0
+        
+        self._lastMessageTimestampNs = 0
+        self._pendingBatch["count"] = 0
+        self._pendingBatch["bytes"] = 0
+        self._pendingBatch["topics"].clear()
         
         self.activeTopics.clear()
         self.logger.info("ZeroMQPublisher statistics reset")